@@ -21,6 +21,7 @@ DEBUG_LOG_FILE = LOGS_DIR / "debug.log"
 
 # Configuration
 CONFIG_FILE = "config.json"
+STARTUP_CACHE_FILE = APP_DIR / ".startup_ok"
 
 # Default settings
 DEFAULT_JAVA_PATH = "java"
@@ -7,7 +7,6 @@ import traceback
 import sys
 import os
 import json
-import platform
 import psutil
 from datetime import datetime
 from pathlib import Path
@@ -43,17 +42,27 @@ class ErrorCategory(Enum):
     HEALTH_CHECK_ERROR = "health_check_error"
     UNKNOWN = "unknown"
 
+_directories_ready = False
+
+def _ensure_directories():
+    """Create the logs and error reports directories on first use"""
+    global _directories_ready
+    if not _directories_ready:
+        for directory in (ERROR_LOG_FILE.parent, ERROR_REPORTS_DIR):
+            os.makedirs(directory, exist_ok=True)
+        _directories_ready = True
+
 class ErrorHandler:
     """Enhanced error handling with recovery suggestions and reporting"""
     
     def __init__(self):
+        # Ensure logs and error reports directories exist (once per process)
+        _ensure_directories()
+        
         self.setup_error_logging()
         self.error_count = 0
         self.error_reports = []
         
-        # Ensure error reports directory exists
-        ERROR_REPORTS_DIR.mkdir(exist_ok=True)
-        
         # Recovery suggestions database
         self.recovery_suggestions = {
             "server_startup": {
@@ -95,25 +104,21 @@ class ErrorHandler:
     def setup_error_logging(self):
         """Setup dedicated error logging"""
         try:
-            # Ensure logs directory exists
-            ERROR_LOG_FILE.parent.mkdir(exist_ok=True)
-            
             # Create error logger
             self.error_logger = logging.getLogger('error_handler')
             self.error_logger.setLevel(logging.ERROR)
             
-            # Create file handler for errors
-            error_handler = logging.FileHandler(ERROR_LOG_FILE)
-            error_handler.setLevel(logging.ERROR)
-            
-            # Create formatter
-            formatter = logging.Formatter(
-                '%(asctime)s - %(levelname)s - %(message)s'
-            )
-            error_handler.setFormatter(formatter)
-            
-            # Add handler to logger
+            # Add a file handler for errors (shared by all ErrorHandler instances)
             if not self.error_logger.handlers:
+                error_handler = logging.FileHandler(ERROR_LOG_FILE)
+                error_handler.setLevel(logging.ERROR)
+                
+                # Create formatter
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(levelname)s - %(message)s'
+                )
+                error_handler.setFormatter(formatter)
+                
                 self.error_logger.addHandler(error_handler)
                 
         except Exception as e:
@@ -243,20 +248,23 @@ class ErrorHandler:
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information for error reports"""
+        # platform is only needed when an error report is actually built
+        import platform
         try:
+            memory = psutil.virtual_memory()
             return {
                 'platform': platform.platform(),
                 'python_version': sys.version,
                 'cpu_count': psutil.cpu_count(),
-                'memory_total': psutil.virtual_memory().total,
-                'memory_available': psutil.virtual_memory().available,
-                'disk_usage': psutil.disk_usage('/').percent if os.path.exists('/') else psutil.disk_usage('C:').percent,
+                'memory_total': memory.total,
+                'memory_available': memory.available,
+                'disk_usage': psutil.disk_usage('C:\\' if os.name == 'nt' else '/').percent,
                 'working_directory': str(Path.cwd())
             }
         except Exception as e:
             return {
                 'error': f'Could not gather system info: {e}',
-                'platform': platform.system() if hasattr(platform, 'system') else 'unknown'
+                'platform': sys.platform
             }
     
     def save_error_report(self, error_info: Dict[str, Any]) -> str:
@@ -0,0 +1,103 @@
+"""
+Shared file helpers for Minecraft Server Manager
+JSON serialization (orjson when available), directory walking and file copies
+"""
+
+import os
+import sys
+import json
+import errno
+import shutil
+from typing import Any, Callable, Optional
+
+# Prefer orjson for JSON serialization, with fallback to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# fcntl is POSIX-only; used for FICLONE reflink copies on Linux
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+def load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dump_json(data: Any, indent: bool = True,
+              default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize to UTF-8 JSON (indented unless indent=False), using orjson when available.
+
+    orjson serializes dataclasses and datetimes itself; when `default` is given,
+    dataclasses are passed to it instead so both backends produce the same shape.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(data, default=default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=default).encode('utf-8')
+
+def iter_files(dirpath: str):
+    """Recursively yield os.DirEntry objects for regular files under dirpath"""
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return
+
+# Linux ioctl that shares file extents on CoW filesystems (btrfs, XFS)
+_FICLONE = 0x40049409
+_REFLINK_UNSUPPORTED = {errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.EPERM,
+                        getattr(errno, "ENOTSUP", errno.EOPNOTSUPP), errno.EOPNOTSUPP}
+_clonefile = None
+
+def _reflink(src: str, dst: str) -> bool:
+    """Try to clone src to dst without copying data. Returns True on success."""
+    global _clonefile
+    try:
+        if sys.platform.startswith("linux") and fcntl is not None:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+        
+        if sys.platform == "darwin":
+            import ctypes
+            if _clonefile is None:
+                libc = ctypes.CDLL(None, use_errno=True)
+                _clonefile = libc.clonefile
+                _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+            # clonefile(2) refuses to overwrite an existing destination
+            if os.path.lexists(dst):
+                os.remove(dst)
+            if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return True
+            err = ctypes.get_errno()
+            if err not in _REFLINK_UNSUPPORTED:
+                raise OSError(err, os.strerror(err), dst)
+    except OSError as e:
+        if e.errno not in _REFLINK_UNSUPPORTED:
+            raise
+    return False
+
+def copy_file(src: str, dst: str) -> str:
+    """copy2 replacement that reflinks on copy-on-write filesystems"""
+    if _reflink(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+    return dst
@@ -1085,7 +1085,7 @@ class MinecraftServerGUI:
                     if self.modupdatechecker:
                         self.modupdatechecker.save_update_cache()
                     if self.modconfigmanager:
-                        self.modconfigmanager.save_config_database()
+                        self.modconfigmanager.shutdown()
                     
                     logging.info("Mod management components shut down successfully")
                 except Exception as mod_cleanup_error:
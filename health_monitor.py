@@ -3,35 +3,113 @@ Health monitoring for Minecraft Server Manager
 """
 
 import time
+import queue
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Optional
+from dataclasses import dataclass
 from datetime import datetime
 
-# Try to import psutil, with fallback if not available
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    print("Warning: psutil not available. Health monitoring features will be limited.")
-
 from error_handler import ErrorHandler, ErrorSeverity
+from file_utils import dump_json
+
+@dataclass
+class ResourceMetrics:
+    """System resource usage sample"""
+    __slots__ = ('cpu_percent', 'memory_percent', 'memory_available_gb',
+                 'disk_percent', 'disk_free_gb', 'note')
+    cpu_percent: float
+    memory_percent: float
+    memory_available_gb: float
+    disk_percent: float
+    disk_free_gb: float
+    note: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for health status reporting"""
+        data = {
+            'cpu_percent': self.cpu_percent,
+            'memory_percent': self.memory_percent,
+            'memory_available_gb': self.memory_available_gb,
+            'disk_percent': self.disk_percent,
+            'disk_free_gb': self.disk_free_gb
+        }
+        if self.note:
+            data['note'] = self.note
+        return data
+
+def _json_default(obj):
+    """Serialize ResourceMetrics records embedded in health status dicts"""
+    if isinstance(obj, ResourceMetrics):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class HealthStatus(dict):
+    """Health status passed to callbacks, with JSON serialized once per tick"""
+    __slots__ = ('_json',)
+    
+    @property
+    def json(self) -> str:
+        """JSON representation, computed on first access"""
+        try:
+            return self._json
+        except AttributeError:
+            self._json = dump_json(dict(self), indent=False, default=_json_default).decode('utf-8')
+            return self._json
 
 class ServerHealthMonitor:
     """Enhanced server health monitoring"""
     
+    # Issue message templates, only formatted when an issue is found
+    _MSG_SRV_MEM = "High server memory usage: {:.1f}%"
+    _MSG_SYS_MEM = "High system memory usage: {:.1f}%"
+    _MSG_CPU = "High CPU usage: {:.1f}%"
+    _MSG_DISK = "Low disk space: {:.1f}% used"
+    _MSG_THREADS = "High thread count: {}"
+    
+    # (source, metric, critical, warning, issue threshold, issue message)
+    _THRESHOLDS = (
+        ('server', 'memory_percent', 90, 75, 90, _MSG_SRV_MEM),
+        ('system', 'memory_percent', 95, 85, 90, _MSG_SYS_MEM),
+        ('system', 'cpu_percent', 95, 80, 90, _MSG_CPU),
+        ('system', 'disk_percent', 95, 85, 90, _MSG_DISK),
+    )
+    _SEVERITY_NAMES = ('good', 'warning', 'critical')
+    _GB = 1024 ** 3
+    
+    # psutil module, imported on first resource check (False if unavailable)
+    _psutil = None
+    
+    @classmethod
+    def _get_psutil(cls):
+        """Import psutil once, with fallback if not available"""
+        if cls._psutil is None:
+            try:
+                import psutil
+                cls._psutil = psutil
+            except ImportError:
+                cls._psutil = False
+                print("Warning: psutil not available. Health monitoring features will be limited.")
+        return cls._psutil
+    
     def __init__(self, process_manager, config):
         self.process_manager = process_manager
         self.config = config
         self.error_handler = ErrorHandler()
         self.monitoring_active = False
         self.monitor_thread = None
+        self.dispatch_thread = None
         self.health_callbacks = []
+        self._cb_queue = queue.Queue(maxsize=4)
         self.alerts = []
         self.health_history = []
+        self._current = None
+        self._probe_executor = None
+        self._disk_path = 'C:\\' if os.name == 'nt' else '.'
+        self._stopped_status = None
         
     def start_monitoring(self):
         """Start health monitoring"""
@@ -39,6 +117,8 @@ class ServerHealthMonitor:
             self.monitoring_active = True
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
+            self.dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+            self.dispatch_thread.start()
             logging.info("Health monitoring started")
     
     def stop_monitoring(self):
@@ -46,6 +126,11 @@ class ServerHealthMonitor:
         self.monitoring_active = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
+        if self.dispatch_thread:
+            self.dispatch_thread.join(timeout=1)
+        if self._probe_executor:
+            self._probe_executor.shutdown(wait=False)
+            self._probe_executor = None
         logging.info("Health monitoring stopped")
     
     def register_health_callback(self, callback: Callable):
@@ -58,15 +143,29 @@ class ServerHealthMonitor:
             try:
                 health_status = self.check_server_health()
                 
-                # Notify callbacks
-                for callback in self.health_callbacks:
+                # Hand off to the dispatch thread, dropping the oldest pending status
+                callback_status = HealthStatus(health_status)
+                try:
+                    self._cb_queue.put_nowait(callback_status)
+                except queue.Full:
                     try:
-                        callback(health_status)
-                    except Exception as e:
-                        self.error_handler.handle_error(e, "health_callback", ErrorSeverity.LOW)
+                        self._cb_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._cb_queue.put_nowait(callback_status)
+                
+                # Store history, collapsing unchanged consecutive entries
+                last = self.health_history[-1] if self.health_history else None
+                if (last is not None
+                        and last.get('overall_status') == health_status.get('overall_status')
+                        and last.get('issues') == health_status.get('issues')):
+                    last['count'] = last.get('count', 1) + 1
+                    last['last_ts'] = health_status['timestamp']
+                else:
+                    self.health_history.append(health_status)
                 
-                # Store history
-                self.health_history.append(health_status)
+                # Publish latest status for readers (single reference assignment)
+                self._current = health_status
                 
                 # Limit history size
                 if len(self.health_history) > 100:
@@ -78,33 +177,53 @@ class ServerHealthMonitor:
                 self.error_handler.handle_error(e, "health_monitor", ErrorSeverity.LOW)
                 time.sleep(60)
     
+    def _dispatch_loop(self):
+        """Callback dispatch loop, decoupled from health sampling"""
+        while self.monitoring_active:
+            try:
+                health_status = self._cb_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            
+            # Notify callbacks
+            for callback in self.health_callbacks:
+                try:
+                    callback(health_status)
+                except Exception as e:
+                    self.error_handler.handle_error(e, "health_callback", ErrorSeverity.LOW)
+    
     def check_server_health(self) -> Dict[str, Any]:
         """Check server health and return status"""
         try:
+            timestamp = datetime.now().isoformat()
+            running = self.process_manager.is_server_running()
+            
+            # Server still stopped: reuse the previous result with a fresh timestamp
+            if not running and self._stopped_status is not None:
+                return dict(self._stopped_status, timestamp=timestamp)
+            
             health_status = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'overall_status': 'unknown',
                 'metrics': {},
                 'issues': []
             }
             
             # Check if server is running
-            if self.process_manager.is_server_running():
+            if running:
+                self._stopped_status = None
+                
                 # Get detailed server metrics
                 server_status = self.process_manager.get_server_status()
                 health_status['metrics']['process'] = server_status
                 
-                # Check resource usage
-                resource_metrics = self._check_system_resources()
-                health_status['metrics']['resources'] = resource_metrics
-                
-                # Determine overall status
-                health_status['overall_status'] = self._determine_overall_status(
-                    server_status, resource_metrics
-                )
+                # Check resource usage; kept as the slotted record (to_dict() on demand)
+                resources = self._check_system_resources()
+                health_status['metrics']['resources'] = resources
                 
-                # Check for issues
-                issues = self._check_for_issues(server_status, resource_metrics)
+                # Determine overall status and check for issues
+                overall_status, issues = self._evaluate(server_status, resources)
+                health_status['overall_status'] = overall_status
                 health_status['issues'] = issues
                 
                 # Generate alerts if needed
@@ -113,6 +232,7 @@ class ServerHealthMonitor:
             else:
                 health_status['overall_status'] = 'stopped'
                 health_status['metrics']['process'] = {'status': 'stopped'}
+                self._stopped_status = dict(health_status)
             
             return health_status
             
@@ -124,109 +244,78 @@ class ServerHealthMonitor:
                 'error': str(e)
             }
     
-    def _check_system_resources(self) -> Dict[str, Any]:
+    def _check_system_resources(self) -> Optional[ResourceMetrics]:
         """Check system resource usage"""
         try:
-            if PSUTIL_AVAILABLE:
-                # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=1)
+            psutil = self._get_psutil()
+            if psutil:
+                # Run the probes concurrently; cpu_percent blocks for its interval
+                if self._probe_executor is None:
+                    self._probe_executor = ThreadPoolExecutor(
+                        max_workers=4, thread_name_prefix="health-probe"
+                    )
+                executor = self._probe_executor
+                cpu_future = executor.submit(psutil.cpu_percent, interval=1)
+                memory_future = executor.submit(psutil.virtual_memory)
+                disk_future = executor.submit(psutil.disk_usage, self._disk_path)
                 
-                # Memory usage
-                memory = psutil.virtual_memory()
+                cpu_percent = cpu_future.result()
+                memory = memory_future.result()
+                disk = disk_future.result()
                 
-                # Disk usage
-                disk = psutil.disk_usage('.' if os.name != 'nt' else 'C:')
-                
-                return {
-                    'cpu_percent': cpu_percent,
-                    'memory_percent': memory.percent,
-                    'memory_available_gb': memory.available / 1024 / 1024 / 1024,
-                    'disk_percent': (disk.used / disk.total) * 100,
-                    'disk_free_gb': disk.free / 1024 / 1024 / 1024
-                }
+                return ResourceMetrics(
+                    cpu_percent=cpu_percent,
+                    memory_percent=memory.percent,
+                    memory_available_gb=memory.available / self._GB,
+                    disk_percent=(disk.used / disk.total) * 100,
+                    disk_free_gb=disk.free / self._GB,
+                    note=''
+                )
             else:
                 # Fallback without psutil
-                return {
-                    'cpu_percent': 0,
-                    'memory_percent': 0,
-                    'memory_available_gb': 0,
-                    'disk_percent': 0,
-                    'disk_free_gb': 0,
-                    'note': 'Limited monitoring - psutil not available'
-                }
+                return ResourceMetrics(
+                    cpu_percent=0,
+                    memory_percent=0,
+                    memory_available_gb=0,
+                    disk_percent=0,
+                    disk_free_gb=0,
+                    note='Limited monitoring - psutil not available'
+                )
             
         except Exception as e:
             self.error_handler.handle_error(e, "check_system_resources", ErrorSeverity.LOW)
-            return {}
+            return None
     
-    def _determine_overall_status(self, server_status: Dict, resource_metrics: Dict) -> str:
-        """Determine overall health status"""
-        try:
-            if server_status.get('status') != 'running':
-                return 'critical'
-            
-            # Check memory usage
-            server_memory = server_status.get('memory_percent', 0)
-            system_memory = resource_metrics.get('memory_percent', 0)
-            
-            if server_memory > 90 or system_memory > 95:
-                return 'critical'
-            elif server_memory > 75 or system_memory > 85:
-                return 'warning'
-            
-            # Check CPU usage
-            cpu_usage = resource_metrics.get('cpu_percent', 0)
-            if cpu_usage > 95:
-                return 'critical'
-            elif cpu_usage > 80:
-                return 'warning'
-            
-            # Check disk space
-            disk_usage = resource_metrics.get('disk_percent', 0)
-            if disk_usage > 95:
-                return 'critical'
-            elif disk_usage > 85:
-                return 'warning'
-            
-            return 'good'
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, "determine_overall_status", ErrorSeverity.LOW)
-            return 'unknown'
-    
-    def _check_for_issues(self, server_status: Dict, resource_metrics: Dict) -> List[str]:
-        """Check for specific issues"""
+    def _evaluate(self, server_status: Dict, resources: Optional[ResourceMetrics]):
+        """Determine overall health status and collect issues in a single pass"""
         issues = []
         
         try:
-            # Memory issues
-            server_memory = server_status.get('memory_percent', 0)
-            if server_memory > 90:
-                issues.append(f"High server memory usage: {server_memory:.1f}%")
+            severity = 0 if server_status.get('status') == 'running' else 2
             
-            system_memory = resource_metrics.get('memory_percent', 0)
-            if system_memory > 90:
-                issues.append(f"High system memory usage: {system_memory:.1f}%")
-            
-            # CPU issues
-            cpu_usage = resource_metrics.get('cpu_percent', 0)
-            if cpu_usage > 90:
-                issues.append(f"High CPU usage: {cpu_usage:.1f}%")
-            
-            # Disk space issues
-            disk_usage = resource_metrics.get('disk_percent', 0)
-            if disk_usage > 90:
-                issues.append(f"Low disk space: {disk_usage:.1f}% used")
+            for source, key, critical, warning, issue_threshold, message in self._THRESHOLDS:
+                if source == 'server':
+                    value = server_status.get(key, 0)
+                else:
+                    value = getattr(resources, key, 0)
+                if value > critical:
+                    severity = 2
+                elif value > warning and severity < 1:
+                    severity = 1
+                if value > issue_threshold:
+                    issues.append(message.format(value))
             
             # Server-specific checks
-            if server_status.get('threads', 0) > 200:
-                issues.append(f"High thread count: {server_status['threads']}")
+            threads = server_status.get('threads', 0)
+            if threads > 200:
+                issues.append(self._MSG_THREADS.format(threads))
+            
+            return self._SEVERITY_NAMES[severity], issues
             
         except Exception as e:
-            self.error_handler.handle_error(e, "check_for_issues", ErrorSeverity.LOW)
+            self.error_handler.handle_error(e, "evaluate_health", ErrorSeverity.LOW)
             issues.append("Error checking for issues")
-        
-        return issues
+            return 'unknown', issues
     
     def _generate_alerts(self, issues: List[str]):
         """Generate alerts for issues"""
@@ -243,10 +332,8 @@ class ServerHealthMonitor:
             self.alerts = self.alerts[-25:]
     
     def get_current_health(self) -> Dict[str, Any]:
-        """Get current health status"""
-        if self.health_history:
-            return self.health_history[-1]
-        return None
+        """Get current health status (metrics['resources'] is a ResourceMetrics; use to_dict())"""
+        return self._current
     
     def get_recent_alerts(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get recent alerts"""
@@ -265,26 +352,28 @@ class ServerHealthMonitor:
             cutoff_time = datetime.now().timestamp() - (hours * 3600)
             recent_history = [
                 h for h in self.health_history 
-                if datetime.fromisoformat(h['timestamp']).timestamp() > cutoff_time
+                if datetime.fromisoformat(h.get('last_ts', h['timestamp'])).timestamp() > cutoff_time
             ]
             
             if not recent_history:
                 return f"No health data for the last {hours} hours"
             
-            # Count status occurrences
+            # Count status occurrences, weighted by collapsed entry counts
             status_counts = {}
             for entry in recent_history:
                 status = entry['overall_status']
-                status_counts[status] = status_counts.get(status, 0) + 1
+                status_counts[status] = status_counts.get(status, 0) + entry.get('count', 1)
             
-            total_checks = len(recent_history)
-            summary = f"Health summary for last {hours} hours ({total_checks} checks):\n"
+            total_checks = sum(status_counts.values())
+            parts = [f"Health summary for last {hours} hours ({total_checks} checks):"]
             
+            inv_total = 100.0 / total_checks
             for status, count in status_counts.items():
-                percentage = (count / total_checks) * 100
-                summary += f"- {status.title()}: {count} ({percentage:.1f}%)\n"
+                percentage = count * inv_total
+                parts.append(f"- {status.capitalize()}: {count} ({percentage:.1f}%)")
             
-            return summary
+            parts.append("")
+            return "\n".join(parts)
             
         except Exception as e:
             self.error_handler.handle_error(e, "get_health_summary", ErrorSeverity.LOW)
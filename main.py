@@ -5,105 +5,168 @@ Main entry point with comprehensive error handling, logging, and mod support
 
 import os
 import sys
+import time
 import logging
-import traceback
-from pathlib import Path
-from datetime import datetime
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger("msm")
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import core modules
-from constants import APP_NAME, VERSION, APP_DIR
+from constants import APP_NAME, VERSION, APP_DIR, LOGS_DIR, STARTUP_CACHE_FILE
 from config import Config
 from error_handler import ErrorHandler, ErrorSeverity
 
-# MOD MANAGEMENT IMPORTS - With fallback handling
-try:
-    from mod_manager import ModManager
-    from mod_backup_manager import ModBackupManager
-    from mod_dependency_resolver import ModDependencyResolver
-    from mod_update_checker import ModUpdateChecker
-    from mod_config_manager import ModConfigManager
-    from mod_downloader import ModDownloader
-    MOD_MANAGEMENT_AVAILABLE = True
-    print("✅ Mod management modules loaded successfully")
-except ImportError as e:
-    MOD_MANAGEMENT_AVAILABLE = False
-    print(f"⚠️ Mod management not available: {e}")
-    # Create dummy classes to prevent import errors
-    ModManager = None
-    ModBackupManager = None
-    ModDependencyResolver = None
-    ModUpdateChecker = None
-    ModConfigManager = None
-    ModDownloader = None
+# MOD MANAGEMENT IMPORTS - Resolved lazily on first use, with fallback handling
+_LAZY_MOD_IMPORTS = {
+    "ModManager": "mod_manager",
+    "ModBackupManager": "mod_backup_manager",
+    "ModDependencyResolver": "mod_dependency_resolver",
+    "ModUpdateChecker": "mod_update_checker",
+    "ModConfigManager": "mod_config_manager",
+    "ModDownloader": "mod_downloader",
+}
+
+def load_mod_management() -> bool:
+    """Import the mod management modules once and report availability"""
+    available = globals().get("MOD_MANAGEMENT_AVAILABLE")
+    if available is not None:
+        return available
+    
+    try:
+        loaded = {
+            name: getattr(importlib.import_module(module), name)
+            for name, module in _LAZY_MOD_IMPORTS.items()
+        }
+        globals().update(loaded)
+        globals()["MOD_MANAGEMENT_AVAILABLE"] = True
+        print("✅ Mod management modules loaded successfully")
+    except ImportError as e:
+        print(f"⚠️ Mod management not available: {e}")
+        # Create dummy classes to prevent import errors
+        globals().update(dict.fromkeys(_LAZY_MOD_IMPORTS))
+        globals()["MOD_MANAGEMENT_AVAILABLE"] = False
+    
+    return globals()["MOD_MANAGEMENT_AVAILABLE"]
+
+def __getattr__(name):
+    """Resolve mod management classes and availability on first access (PEP 562)"""
+    if name in _LAZY_MOD_IMPORTS or name == "MOD_MANAGEMENT_AVAILABLE":
+        load_mod_management()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Force-resolve lazy imports (e.g. for CI or frozen builds)
+if os.environ.get("MSM_EAGER_IMPORT") == "1":
+    load_mod_management()
 
 class MinecraftServerManager:
     """Main application class with comprehensive mod management integration"""
     
     def __init__(self):
         """Initialize the Minecraft Server Manager with full mod support"""
+        self._last_log_ts = {}
+        self._server_dir_cache = None
+        self._initializing = True
+        self._shutdown_requested = False
+        self._shutdown_done = False
         self.setup_logging()
         self.error_handler = ErrorHandler()
         
+        # Setup signal handlers first so Ctrl-C during initialization is handled
+        self.setup_signal_handlers()
+        
         try:
-            logging.info(f"Starting {APP_NAME} v{VERSION}")
-            logging.info(f"Python version: {sys.version}")
-            logging.info(f"Working directory: {os.getcwd()}")
-            logging.info(f"App directory: {APP_DIR}")
+            log.info(f"Starting {APP_NAME} v{VERSION}")
+            log.info(f"Python version: {sys.version}")
+            log.info(f"Working directory: {os.getcwd()}")
+            log.info(f"App directory: {APP_DIR}")
             
             # Initialize core configuration
             self.config = Config()
-            logging.info("✅ Configuration system initialized")
+            log.info("✅ Configuration system initialized")
+            self.check_shutdown_requested()
             
             # Validate environment
             self.validate_environment()
+            self.check_shutdown_requested()
             
             # Initialize core managers
             self.initialize_core_managers()
+            self.check_shutdown_requested()
             
             # Initialize MOD MANAGEMENT system
             self.initialize_mod_management()
+            self.check_shutdown_requested()
             
-            # Setup signal handlers
-            self.setup_signal_handlers()
-            
-            logging.info("✅ Minecraft Server Manager initialized successfully")
+            self._initializing = False
+            log.info("✅ Minecraft Server Manager initialized successfully")
             
         except Exception as e:
             self.handle_initialization_error(e)
             raise
     
+    def check_shutdown_requested(self):
+        """Stop between initialization steps if a shutdown signal arrived"""
+        if self._shutdown_requested:
+            log.info("Shutdown requested during initialization")
+            self.shutdown()
+            sys.exit(0)
+    
     def setup_logging(self):
         """Setup comprehensive logging system"""
+        # Flush console output per line even when stdout is piped or redirected
+        try:
+            sys.stdout.reconfigure(line_buffering=True)
+        except AttributeError:
+            pass
+        
         try:
             # Ensure logs directory exists
-            logs_dir = APP_DIR / "logs"
-            logs_dir.mkdir(exist_ok=True)
+            os.makedirs(LOGS_DIR, exist_ok=True)
             
             # Generate log filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d")
-            log_file = logs_dir / f"minecraft_server_manager_{timestamp}.log"
+            timestamp = time.strftime("%Y%m%d")
+            log_file = LOGS_DIR / f"minecraft_server_manager_{timestamp}.log"
+            
+            # Configure logging with file and console handlers fed from a queue,
+            # so callers only enqueue records and a background thread does the I/O
+            import queue
+            from logging.handlers import QueueHandler, QueueListener, MemoryHandler, RotatingFileHandler
             
-            # Configure logging with both file and console handlers
+            log_queue = queue.Queue(-1)
             logging.basicConfig(
                 level=logging.INFO,
                 format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(log_file, encoding='utf-8'),
-                    logging.StreamHandler(sys.stdout)
-                ]
+                handlers=[QueueHandler(log_queue)]
             )
             
+            # Buffer file writes; errors (and a full buffer) flush immediately
+            self._log_file_buffer = MemoryHandler(
+                256,
+                flushLevel=logging.ERROR,
+                target=RotatingFileHandler(
+                    log_file, maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8'
+                ),
+                flushOnClose=True
+            )
+            self._log_listener = QueueListener(
+                log_queue,
+                self._log_file_buffer,
+                logging.StreamHandler(sys.stdout)
+            )
+            self._log_listener.start()
+            
             # Set specific log levels for different modules
             logging.getLogger('urllib3').setLevel(logging.WARNING)
             logging.getLogger('requests').setLevel(logging.WARNING)
             
             # Create mod management logger
-            if MOD_MANAGEMENT_AVAILABLE:
-                mod_logger = logging.getLogger('mod_management')
-                mod_logger.setLevel(logging.INFO)
+            mod_logger = logging.getLogger('mod_management')
+            mod_logger.setLevel(logging.INFO)
             
             print(f"✅ Logging initialized - Log file: {log_file}")
             
@@ -115,85 +178,125 @@ class MinecraftServerManager:
     def validate_environment(self):
         """Validate the runtime environment"""
         try:
-            logging.info("Validating environment...")
+            log.info("Validating environment...")
             
             # Check Python version
             if sys.version_info < (3, 8):
                 raise RuntimeError(f"Python 3.8+ required, found {sys.version}")
             
-            # Check required directories
-            required_dirs = ['gui', 'gui/tabs', 'gui/components', 'gui/utils']
-            missing_dirs = []
-            
-            for dir_name in required_dirs:
-                if not os.path.exists(dir_name):
-                    missing_dirs.append(dir_name)
-            
-            if missing_dirs:
-                logging.warning(f"Missing directories: {missing_dirs}")
-                # Create missing directories
-                for dir_name in missing_dirs:
-                    os.makedirs(dir_name, exist_ok=True)
-                    logging.info(f"Created directory: {dir_name}")
-            
-            # Check file permissions
-            test_file = APP_DIR / "permission_test.tmp"
-            try:
-                test_file.write_text("test")
-                test_file.unlink()
-                logging.info("✅ File permissions validated")
-            except Exception as e:
-                logging.error(f"❌ File permission error: {e}")
-                raise RuntimeError("Insufficient file permissions")
-            
-            # Validate mod management requirements
-            if MOD_MANAGEMENT_AVAILABLE:
-                self.validate_mod_management_environment()
-            
-            logging.info("✅ Environment validation completed")
+            fast_start = "--fast" in sys.argv or os.environ.get("MC_MANAGER_FAST") == "1"
+            if fast_start:
+                log.info("⚡ Fast start - skipping environment checks")
+            elif self.is_startup_cache_valid():
+                log.info("✅ Validation cache hit - skipping filesystem checks")
+            else:
+                # Ensure required directories exist, listing gui/ once
+                try:
+                    with os.scandir('gui') as entries:
+                        present = {entry.name for entry in entries if entry.is_dir()}
+                except FileNotFoundError:
+                    present = set()
+                
+                for sub_dir in ('tabs', 'components', 'utils'):
+                    if sub_dir not in present:
+                        os.makedirs(os.path.join('gui', sub_dir), exist_ok=True)
+                        log.info(f"Created directory: gui/{sub_dir}")
+                
+                # Check file permissions
+                if not os.access(str(APP_DIR), os.W_OK):
+                    log.error(f"❌ File permission error: {APP_DIR} is not writable")
+                    raise RuntimeError("Insufficient file permissions")
+                log.info("✅ File permissions validated")
+                
+                self.write_startup_cache()
+            
+            # Validate mod management requirements; find_spec only locates the mod
+            # modules, leaving the import to initialize_mod_management
+            if not fast_start:
+                from importlib.util import find_spec
+                if all(find_spec(module) is not None for module in _LAZY_MOD_IMPORTS.values()):
+                    self.validate_mod_management_environment()
+            
+            log.info("✅ Environment validation completed")
             
         except Exception as e:
             error_info = self.error_handler.handle_error(e, "environment_validation", ErrorSeverity.HIGH)
-            logging.error(f"Environment validation failed: {error_info['message']}")
+            log.error(f"Environment validation failed: {error_info['message']}")
             raise
     
+    def is_startup_cache_valid(self) -> bool:
+        """Check whether a previous run already validated this version's environment"""
+        if "--no-cache" in sys.argv:
+            return False
+        try:
+            # Stale if the app changed after the cache was written; a frozen
+            # (PyInstaller) build has no main.py on disk, so use the executable
+            app_file = sys.executable if getattr(sys, 'frozen', False) else __file__
+            if STARTUP_CACHE_FILE.stat().st_mtime < os.stat(app_file).st_mtime:
+                return False
+            return STARTUP_CACHE_FILE.read_text(encoding='utf-8') == f"{VERSION}\n"
+        except OSError:
+            return False
+    
+    def write_startup_cache(self):
+        """Record a successful environment validation for faster warm starts"""
+        try:
+            STARTUP_CACHE_FILE.write_text(f"{VERSION}\n", encoding='utf-8')
+        except OSError as e:
+            log.warning(f"Could not write startup cache: {e}")
+    
     def validate_mod_management_environment(self):
         """Validate mod management specific requirements"""
         try:
-            logging.info("Validating mod management environment...")
+            log.info("Validating mod management environment...")
             
             # Check required Python packages
+            # find_spec locates packages without executing them
+            from importlib.util import find_spec
             required_packages = ['requests', 'toml']
-            missing_packages = []
-            
-            for package in required_packages:
-                try:
-                    __import__(package)
-                except ImportError:
-                    missing_packages.append(package)
+            missing_packages = [package for package in required_packages if find_spec(package) is None]
             
             if missing_packages:
-                logging.warning(f"Missing optional packages for mod management: {missing_packages}")
-                logging.warning("Some mod features may be limited. Install with: pip install " + " ".join(missing_packages))
-            
-            # Check network connectivity for mod repositories (optional)
-            try:
-                import requests
-                response = requests.get("https://api.modrinth.com/v2/", timeout=5)
-                if response.status_code == 200:
-                    logging.info("✅ Modrinth API connectivity verified")
-            except Exception as e:
-                logging.warning(f"Modrinth API not accessible: {e}")
+                log.warning(f"Missing optional packages for mod management: {missing_packages}")
+                log.warning("Some mod features may be limited. Install with: pip install " + " ".join(missing_packages))
             
-            logging.info("✅ Mod management environment validated")
+            log.info("✅ Mod management environment validated")
             
         except Exception as e:
-            logging.warning(f"Mod management environment validation warning: {e}")
+            log.warning(f"Mod management environment validation warning: {e}")
+    
+    def start_modrinth_probe(self):
+        """Check Modrinth API connectivity in the background"""
+        self.modrinth_reachable = None
+        if self.config.get_mod_setting("offline_mode", False):
+            log.info("Offline mode enabled - skipping Modrinth API check")
+            return
+        
+        import threading
+        threading.Thread(target=self._probe_modrinth, daemon=True).start()
+    
+    def _probe_modrinth(self):
+        """Check network connectivity for mod repositories (optional)"""
+        try:
+            requests = importlib.import_module("requests")
+            response = requests.get("https://api.modrinth.com/v2/", timeout=5)
+            self.modrinth_reachable = response.status_code == 200
+            if self.modrinth_reachable:
+                log.info("✅ Modrinth API connectivity verified")
+        except Exception as e:
+            self.modrinth_reachable = False
+            log.warning(f"Modrinth API not accessible: {e}")
     
     def initialize_core_managers(self):
         """Initialize core application managers"""
         try:
-            logging.info("Initializing core managers...")
+            log.info("Initializing core managers...")
+            
+            # Shared worker pool for background tasks
+            self._executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4,
+                thread_name_prefix="msm"
+            )
             
             # These will be initialized when needed
             self.process_manager = None
@@ -203,22 +306,22 @@ class MinecraftServerManager:
             self.auto_shutdown_manager = None
             self.sleep_manager = None
             
-            logging.info("✅ Core managers prepared for initialization")
+            log.info("✅ Core managers prepared for initialization")
             
         except Exception as e:
             error_info = self.error_handler.handle_error(e, "core_managers_init", ErrorSeverity.HIGH)
-            logging.error(f"Core managers initialization failed: {error_info['message']}")
+            log.error(f"Core managers initialization failed: {error_info['message']}")
             raise
     
     def initialize_mod_management(self):
         """Initialize comprehensive mod management system"""
-        if not MOD_MANAGEMENT_AVAILABLE:
-            logging.warning("⚠️ Mod management not available - skipping initialization")
+        if not load_mod_management():
+            log.warning("⚠️ Mod management not available - skipping initialization")
             self.mod_management_enabled = False
             return
         
         try:
-            logging.info("🔧 Initializing mod management system...")
+            log.info("🔧 Initializing mod management system...")
             
             # Get current server directory
             server_dir = self.get_current_server_directory()
@@ -229,42 +332,24 @@ class MinecraftServerManager:
                 self.error_handler,    # positional: error_handler
                 server_dir=server_dir,  # positional: server directory
             )
-            logging.info("✅ ModManager initialized")
-            
-            # Backup manager
-            self.modbackupmanager = ModBackupManager(
-                modmanager=self.modmanager,
-                config=self.config
-            )
-            logging.info("✅ ModBackupManager initialized")
-            
-            # Dependency resolver
-            self.moddependencyresolver = ModDependencyResolver(
-                modmanager=self.modmanager,
-                config=self.config
-            )
-            logging.info("✅ ModDependencyResolver initialized")
-            
-            # Update checker
-            self.modupdatechecker = ModUpdateChecker(
-                modmanager=self.modmanager,
-                config=self.config
-            )
-            logging.info("✅ ModUpdateChecker initialized")
-            
-            # Config manager
-            self.modconfigmanager = ModConfigManager(
-                modmanager=self.modmanager,
-                config=self.config
-            )
-            logging.info("✅ ModConfigManager initialized")
-            
-            # Downloader
-            self.moddownloader = ModDownloader(
-                modmanager=self.modmanager,
-                config=self.config
-            )
-            logging.info("✅ ModDownloader initialized")
+            log.info("✅ ModManager initialized")
+            
+            # Remaining managers only depend on ModManager; build them concurrently
+            dependent_managers = {
+                'modbackupmanager': ModBackupManager,
+                'moddependencyresolver': ModDependencyResolver,
+                'modupdatechecker': ModUpdateChecker,
+                'modconfigmanager': ModConfigManager,
+                'moddownloader': ModDownloader,
+            }
+            futures = {
+                attr: self._executor.submit(manager_class, modmanager=self.modmanager, config=self.config)
+                for attr, manager_class in dependent_managers.items()
+            }
+            # result() re-raises constructor errors for the handler below
+            for attr, future in futures.items():
+                setattr(self, attr, future.result())
+                log.info(f"✅ {dependent_managers[attr].__name__} initialized")
             
             # Connect managers
             self.modmanager.backupmanager = self.modbackupmanager
@@ -275,12 +360,17 @@ class MinecraftServerManager:
             # Perform initial mod scan if enabled and server directory exists
             if (self.config.get_mod_setting("auto_scan_on_startup", True) and 
                 server_dir and os.path.exists(server_dir)):
-                logging.info("🔍 Performing initial mod scan...")
-                self.modmanager.scan_mods()
+                if self.modmanager.mods_unchanged():
+                    log.info("✅ Mods unchanged since last run - skipping initial scan")
+                else:
+                    log.info("🔍 Performing initial mod scan...")
+                    self.modmanager.scan_mods()
             
             # Start update checking if enabled
             if self.config.get_mod_setting("check_updates_on_startup", False):
-                logging.info("📦 Starting background update check...")
+                log.info("📦 Starting background update check...")
+                # Daemon thread, not the shared pool: pool workers are joined at
+                # interpreter exit, which would hold shutdown for the HTTP timeouts
                 import threading
                 update_thread = threading.Thread(
                     target=self.modupdatechecker.check_for_updates,
@@ -289,12 +379,12 @@ class MinecraftServerManager:
                 update_thread.start()
             
             self.mod_management_enabled = True
-            logging.info("🎉 Mod management system fully initialized!")
+            log.info("🎉 Mod management system fully initialized!")
             
         except Exception as e:
             self.mod_management_enabled = False
             error_info = self.error_handler.handle_error(e, "mod_management_init", ErrorSeverity.MEDIUM)
-            logging.error(f"❌ Mod management initialization failed: {error_info['message']}")
+            log.error(f"❌ Mod management initialization failed: {error_info['message']}")
             
             # Set fallback values
             self.modmanager = None
@@ -304,105 +394,122 @@ class MinecraftServerManager:
             self.modconfigmanager = None
             self.moddownloader = None
             
-            logging.warning("⚠️ Continuing without mod management features")
+            log.warning("⚠️ Continuing without mod management features")
     
     def setup_mod_management_callbacks(self):
         """Setup mod management event callbacks"""
         try:
-            # Register core callbacks
-            if hasattr(self.modmanager, 'registerscancallback'):
-                self.modmanager.register_scan_callback(self.on_mod_scan_progress)
-            
-            if hasattr(self.modmanager, 'registerinstallcallback'):
-                self.modmanager.register_scan_callback(self.on_mod_operation)
-            
-            # Register update callbacks
-            if hasattr(self.modupdatechecker, 'register_completion_callback'):
-                self.modupdatechecker.register_completion_callback(self.on_mod_updates_checked)
-            
-            if hasattr(self.modupdatechecker, 'register_update_found_callback'):
-                self.modupdatechecker.register_update_found_callback(self.on_mod_update_found)
-            
-            # Register download callbacks
-            if hasattr(self.moddownloader, 'register_download_completed_callback'):
-                self.moddownloader.register_download_completed_callback(self.on_mod_download_completed)
-            
-            if hasattr(self.moddownloader, 'register_global_progress_callback'):
-                self.moddownloader.register_global_progress_callback(self.on_mod_download_progress)
-            
-            # Register backup callbacks
-            if hasattr(self.modbackupmanager, 'registercompletioncallback'):
-                self.modbackupmanager.registercompletioncallback(self.on_mod_backup_completed)
-            
-            logging.info("✅ Mod management callbacks registered")
+            callback_bindings = [
+                # Core callbacks
+                (self.modmanager, 'register_scan_callback', self.on_mod_scan_progress),
+                (self.modmanager, 'register_install_callback', self.on_mod_operation),
+                # Update callbacks
+                (self.modupdatechecker, 'register_completion_callback', self.on_mod_updates_checked),
+                (self.modupdatechecker, 'register_update_found_callback', self.on_mod_update_found),
+                # Download callbacks
+                (self.moddownloader, 'register_download_completed_callback', self.on_mod_download_completed),
+                (self.moddownloader, 'register_global_progress_callback', self.on_mod_download_progress),
+                # Backup callbacks
+                (self.modbackupmanager, 'registercompletioncallback', self.on_mod_backup_completed),
+            ]
+            
+            for manager, register_name, callback in callback_bindings:
+                register = getattr(manager, register_name, None)
+                if register:
+                    register(callback)
+            
+            log.info("✅ Mod management callbacks registered")
             
         except Exception as e:
-            logging.error(f"Error setting up mod management callbacks: {e}")
+            log.error(f"Error setting up mod management callbacks: {e}")
     
     def get_current_server_directory(self) -> str:
         """Get the current server directory for mod management"""
         try:
-            # Try to get from config
+            # Try to get from config, reusing the cached result while it is unchanged
             last_jar = self.config.get("last_server_jar", "")
-            if last_jar and os.path.exists(last_jar):
-                return os.path.dirname(last_jar)
+            cache = self._server_dir_cache
+            if cache is not None and cache[0] == last_jar:
+                return cache[1]
             
-            # Default to current working directory
-            return os.getcwd()
+            server_dir = None
+            if last_jar:
+                parent = os.path.dirname(last_jar)
+                try:
+                    os.stat(parent)
+                    server_dir = parent
+                except OSError:
+                    pass
+            
+            if server_dir is None:
+                # Default to current working directory
+                server_dir = os.getcwd()
+            
+            self._server_dir_cache = (last_jar, server_dir)
+            return server_dir
             
         except Exception as e:
-            logging.error(f"Error getting server directory: {e}")
+            log.error(f"Error getting server directory: {e}")
             return os.getcwd()
     
     # MOD MANAGEMENT CALLBACK HANDLERS
-    def on_mod_scan_progress(self, progress: int, message: str):
+    def on_mod_scan_progress(self, stage: str, progress: int, message: str):
         """Handle mod scan progress updates"""
-        logging.info(f"Mod scan: {progress}% - {message}")
+        if log.isEnabledFor(logging.INFO):
+            log.info(f"Mod scan: {progress}% - {message}")
     
     def on_mod_operation(self, operation: str, modinfo, message: str):
         """Handle mod operation notifications"""
         if modinfo:
-            logging.info(f"Mod {operation}: {modinfo.name} - {message}")
+            log.info(f"Mod {operation}: {modinfo.name} - {message}")
         else:
-            logging.info(f"Mod {operation}: {message}")
+            log.info(f"Mod {operation}: {message}")
     
     def on_mod_updates_checked(self, updates_info):
         """Handle mod update check completion"""
         try:
-            available_updates = [u for u in updates_info.values() 
-                               if hasattr(u, 'update_status') and u.update_status.value == "update_available"]
+            # UpdateInfo always carries an update_status (UNKNOWN by default)
+            update_available = "update_available"
+            available_updates = [u for u in updates_info.values()
+                                 if u.update_status.value == update_available]
             
             if available_updates:
-                logging.info(f"📦 Found {len(available_updates)} mod update(s) available")
+                log.info(f"📦 Found {len(available_updates)} mod update(s) available")
                 for update in available_updates:
-                    logging.info(f"  - {update.modid}: {update.current_version} → {update.latest_version}")
+                    log.info(f"  - {update.modid}: {update.current_version} → {update.latest_version}")
             else:
-                logging.info("✅ All mods are up to date")
+                log.info("✅ All mods are up to date")
                 
         except Exception as e:
-            logging.error(f"Error processing mod update results: {e}")
+            log.error(f"Error processing mod update results: {e}")
     
     def on_mod_update_found(self, update_info):
         """Handle individual mod update found"""
-        logging.info(f"📦 Update available for {update_info.modid}: {update_info.current_version} → {update_info.latest_version}")
+        log.info(f"📦 Update available for {update_info.modid}: {update_info.current_version} → {update_info.latest_version}")
     
     def on_mod_download_completed(self, download_task):
         """Handle mod download completion"""
+        self._last_log_ts.pop(download_task.mod_name, None)
         if hasattr(download_task, 'status') and download_task.status.value == "completed":
-            logging.info(f"📥 Downloaded: {download_task.mod_name}")
+            log.info(f"📥 Downloaded: {download_task.mod_name}")
         else:
-            logging.error(f"❌ Download failed: {download_task.mod_name} - {download_task.error_message}")
+            log.error(f"❌ Download failed: {download_task.mod_name} - {download_task.error_message}")
     
     def on_mod_download_progress(self, download_task):
         """Handle mod download progress"""
         if hasattr(download_task, 'progress_percentage'):
-            progress = download_task.progress_percentage
-            if progress > 0 and progress % 25 == 0:  # Log every 25%
-                logging.info(f"📥 Downloading {download_task.mod_name}: {progress:.1f}%")
+            # Log at most every 0.5s per download
+            now = time.monotonic()
+            if now - self._last_log_ts.get(download_task.mod_name, 0.0) < 0.5:
+                return
+            self._last_log_ts[download_task.mod_name] = now
+            
+            if log.isEnabledFor(logging.INFO):
+                log.info(f"📥 Downloading {download_task.mod_name}: {download_task.progress_percentage:.1f}%")
     
     def on_mod_backup_completed(self, backup_type: str, backup_info, message: str):
         """Handle mod backup completion"""
-        logging.info(f"💾 Mod backup completed ({backup_type}): {message}")
+        log.info(f"💾 Mod backup completed ({backup_type}): {message}")
     
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
@@ -410,7 +517,11 @@ class MinecraftServerManager:
             import signal
             
             def signal_handler(signum, frame):
-                logging.info(f"Received signal {signum}, initiating shutdown...")
+                log.info(f"Received signal {signum}, initiating shutdown...")
+                self._shutdown_requested = True
+                if self._initializing:
+                    # Let the current step finish its writes; __init__ stops after it
+                    return
                 self.shutdown()
                 sys.exit(0)
             
@@ -419,10 +530,10 @@ class MinecraftServerManager:
             if hasattr(signal, 'SIGTERM'):
                 signal.signal(signal.SIGTERM, signal_handler)
             
-            logging.info("✅ Signal handlers registered")
+            log.info("✅ Signal handlers registered")
             
         except Exception as e:
-            logging.warning(f"Could not setup signal handlers: {e}")
+            log.warning(f"Could not setup signal handlers: {e}")
     
     def handle_initialization_error(self, error):
         """Handle initialization errors gracefully"""
@@ -437,19 +548,21 @@ class MinecraftServerManager:
                 f"Please check the log file for more details."
             )
             
-            logging.critical(error_msg)
+            log.critical(error_msg)
             print(f"\n❌ CRITICAL ERROR:\n{error_msg}")
             
-            # Try to show GUI error dialog
-            try:
-                import tkinter as tk
-                from tkinter import messagebox
-                root = tk.Tk()
-                root.withdraw()
-                messagebox.showerror("Initialization Error", error_msg)
-                root.destroy()
-            except Exception:
-                pass  # GUI not available
+            # Try to show GUI error dialog (skip tkinter entirely on headless X11 hosts)
+            headless = sys.platform.startswith('linux') and not os.environ.get("DISPLAY")
+            if not headless:
+                try:
+                    import tkinter as tk
+                    from tkinter import messagebox
+                    root = tk.Tk()
+                    root.withdraw()
+                    messagebox.showerror("Initialization Error", error_msg)
+                    root.destroy()
+                except Exception:
+                    pass  # GUI not available
             
         except Exception as e:
             print(f"Error handling initialization error: {e}")
@@ -457,79 +570,137 @@ class MinecraftServerManager:
     def run(self):
         """Run the application"""
         try:
-            logging.info("🚀 Starting GUI...")
+            log.info("🚀 Starting GUI...")
+            
+            # Check mod repository connectivity without blocking the GUI
+            if getattr(self, 'mod_management_enabled', False):
+                self.start_modrinth_probe()
             
             # Import and run GUI
             from gui.main_window import run_gui
             run_gui()
             
         except KeyboardInterrupt:
-            logging.info("Application interrupted by user")
+            log.info("Application interrupted by user")
         except Exception as e:
             error_info = self.error_handler.handle_error(e, "main_run", ErrorSeverity.CRITICAL)
-            logging.critical(f"Critical error in main run: {error_info['message']}")
+            log.critical(f"Critical error in main run: {error_info['message']}")
             raise
         finally:
             self.shutdown()
     
     def shutdown(self):
         """Gracefully shutdown the application"""
+        if self._shutdown_done:
+            return
+        self._shutdown_done = True
+        still_running = False
+        
         try:
-            logging.info("🔄 Shutting down Minecraft Server Manager...")
+            log.info("🔄 Shutting down Minecraft Server Manager...")
             
-            # Shutdown mod management components
-            if hasattr(self, 'mod_management_enabled') and self.mod_management_enabled:
-                try:
-                    logging.info("🔧 Shutting down mod management...")
-                    
-                    if hasattr(self, 'moddownloader') and self.moddownloader:
-                        self.moddownloader.shutdown()
-                    
-                    # Save all mod management data
-                    if hasattr(self, 'modmanager') and self.modmanager:
-                        self.modmanager.save_database()
-                    
-                    if hasattr(self, 'modbackupmanager') and self.modbackupmanager:
-                        self.modbackupmanager.savebackupindex()
-                    
-                    if hasattr(self, 'modupdatechecker') and self.modupdatechecker:
-                        self.modupdatechecker.save_update_cache()
-                    
-                    if hasattr(self, 'modconfigmanager') and self.modconfigmanager:
-                        self.modconfigmanager.save_config_database()
-                    
-                    logging.info("✅ Mod management shutdown completed")
-                    
-                except Exception as e:
-                    logging.error(f"Error shutting down mod management: {e}")
+            shutdown_tasks = []
+            
+            # Shutdown mod management components and save their data
+            if getattr(self, 'mod_management_enabled', False):
+                log.info("🔧 Shutting down mod management...")
+                
+                # Stop the download workers and backup scheduler first, in order:
+                # an install still in progress changes installed_mods, which
+                # save_database iterates
+                for attr in ('moddownloader', 'modbackupmanager'):
+                    manager = getattr(self, attr, None)
+                    if manager:
+                        try:
+                            manager.shutdown()
+                        except Exception as e:
+                            log.error(f"Error during shutdown step {type(manager).__name__}.shutdown: {e}")
+                
+                for attr, method_name in (
+                    ('modmanager', 'save_database'),
+                    ('modupdatechecker', 'save_update_cache'),
+                    ('modconfigmanager', 'shutdown'),
+                ):
+                    manager = getattr(self, attr, None)
+                    if manager:
+                        shutdown_tasks.append(getattr(manager, method_name))
             
             # Save configuration
-            if hasattr(self, 'config') and self.config:
-                self.config.save_config()
+            if getattr(self, 'config', None):
+                shutdown_tasks.append(self.config.save_config)
             
-            logging.info("✅ Shutdown completed successfully")
+            # The remaining saves write independent files, so run them concurrently.
+            # Daemon threads, not a pool: pool workers are joined at interpreter exit,
+            # so a hung save would hold the process past the 5 second deadline
+            if shutdown_tasks:
+                import threading
+                
+                def run_step(task):
+                    try:
+                        task()
+                    except Exception as e:
+                        log.error(f"Error during shutdown step {task.__qualname__}: {e}")
+                
+                threads = []
+                for task in shutdown_tasks:
+                    thread = threading.Thread(target=run_step, args=(task,), daemon=True,
+                                              name=f"Shutdown-{task.__qualname__}")
+                    thread.start()
+                    threads.append((task, thread))
+                
+                deadline = time.monotonic() + 5
+                for task, thread in threads:
+                    thread.join(max(0.0, deadline - time.monotonic()))
+                    if thread.is_alive():
+                        still_running = True
+                        log.warning(f"Shutdown step {task.__qualname__} still running after 5s - not waiting for it")
+            
+            # Stop the shared worker pool
+            executor = getattr(self, '_executor', None)
+            if executor:
+                executor.shutdown(wait=False)
+            
+            log.info("✅ Shutdown completed successfully")
             
         except Exception as e:
-            logging.error(f"Error during shutdown: {e}")
+            log.error(f"Error during shutdown: {e}")
+        
+        # Flush queued log records, stop the logging thread and flush buffered writes.
+        # Leave the listener running while abandoned steps may still log; its thread
+        # is a daemon and logging flushes the file handler at exit
+        log_listener = getattr(self, '_log_listener', None)
+        if log_listener:
+            if not still_running:
+                log_listener.stop()
+                self._log_listener = None
+            self._log_file_buffer.flush()
+
+_BANNER = f"🎮 Starting {APP_NAME} v{VERSION}\n{'=' * 50}\n"
 
 def main():
     """Main entry point with comprehensive error handling"""
     try:
-        print(f"🎮 Starting {APP_NAME} v{VERSION}")
-        print("=" * 50)
+        print(_BANNER, end="")
         
         # Create and run the application
         app = MinecraftServerManager()
+        
+        # Keep startup objects out of future collections and collect gen 0 less often
+        import gc
+        gc.freeze()
+        gc.set_threshold(50000, 10, 10)
+        
         app.run()
         
     except Exception as e:
         print(f"\n❌ FATAL ERROR: {e}")
         print("\nStacktrace:")
+        import traceback
         traceback.print_exc()
         
         # Log the error if possible
         try:
-            logging.critical(f"Fatal error in main(): {e}")
+            log.critical(f"Fatal error in main(): {e}")
         except:
             pass
         
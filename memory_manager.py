@@ -7,7 +7,8 @@ import logging
 import threading
 import time
 import os
-from pathlib import Path
+import weakref
+from bisect import bisect_right
 from typing import Dict, Any, List, Callable
 
 # Try to import psutil, with fallback if not available
@@ -20,6 +21,18 @@ except ImportError:
 
 from error_handler import ErrorHandler, ErrorSeverity
 
+_MB = 1024 ** 2
+_GB = 1024 ** 3
+
+# Memory suggestion tiers: _MEMORY_TIERS[i] applies from _MEMORY_TIER_BOUNDS_GB[i-1] GB up
+_MEMORY_TIER_BOUNDS_GB = (4, 8, 16)
+_MEMORY_TIERS = (
+    ("1G", "256M", "Very low memory system detected"),
+    ("2G", "512M", "Low memory system detected"),
+    ("3G", "1G", "Medium memory system detected"),
+    ("4G", "2G", "High memory system detected"),
+)
+
 class MemoryManager:
     """Enhanced memory management with monitoring and optimization"""
     
@@ -29,11 +42,17 @@ class MemoryManager:
         self.monitor_thread = None
         self.cleanup_callbacks = []
         self.memory_stats = {}
+        self._proc = psutil.Process() if PSUTIL_AVAILABLE else None
+        self._total_ram_bytes = psutil.virtual_memory().total if PSUTIL_AVAILABLE else None
+        self._total_ram_gb = self._total_ram_bytes / _GB if PSUTIL_AVAILABLE else None
+        self._poll_interval = 30
+        self._stop_event = threading.Event()
         
     def start_monitoring(self):
         """Start memory monitoring"""
         if not self.monitoring_active:
             self.monitoring_active = True
+            self._stop_event.clear()
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
             logging.info("Memory monitoring started")
@@ -41,13 +60,18 @@ class MemoryManager:
     def stop_monitoring(self):
         """Stop memory monitoring"""
         self.monitoring_active = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
         logging.info("Memory monitoring stopped")
     
     def register_cleanup_callback(self, callback: Callable):
-        """Register a cleanup callback"""
-        self.cleanup_callbacks.append(callback)
+        """Register a cleanup callback (bound methods are held weakly)"""
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            self.cleanup_callbacks.append(weakref.WeakMethod(callback))
+        else:
+            # Plain functions/lambdas are often only referenced here, so keep them alive
+            self.cleanup_callbacks.append(lambda: callback)
     
     def _monitor_loop(self):
         """Memory monitoring loop"""
@@ -59,28 +83,30 @@ class MemoryManager:
                 if self._should_cleanup():
                     self.cleanup_memory()
                 
-                time.sleep(30)  # Check every 30 seconds
+                # Poll interval adapts to memory pressure; stop_monitoring wakes us early
+                self._stop_event.wait(self._poll_interval)
                 
             except Exception as e:
                 self.error_handler.handle_error(e, "memory_monitor", ErrorSeverity.LOW)
-                time.sleep(60)
+                self._stop_event.wait(60)
     
     def _update_memory_stats(self):
         """Update memory statistics"""
         try:
             if PSUTIL_AVAILABLE:
-                # Process memory
-                process = psutil.Process()
-                process_memory = process.memory_info()
+                # Process memory (percent derived from the cached RAM total,
+                # which is what Process.memory_percent() divides by)
+                with self._proc.oneshot():
+                    process_memory = self._proc.memory_info()
                 
                 # System memory
                 system_memory = psutil.virtual_memory()
                 
                 self.memory_stats = {
-                    'process_memory_mb': process_memory.rss / 1024 / 1024,
-                    'process_memory_percent': process.memory_percent(),
+                    'process_memory_mb': process_memory.rss / _MB,
+                    'process_memory_percent': process_memory.rss / self._total_ram_bytes * 100,
                     'system_memory_percent': system_memory.percent,
-                    'system_available_mb': system_memory.available / 1024 / 1024,
+                    'system_available_mb': system_memory.available / _MB,
                     'last_update': time.time()
                 }
             else:
@@ -94,9 +120,22 @@ class MemoryManager:
                     'note': 'Limited monitoring - psutil not available'
                 }
             
+            self._poll_interval = self._compute_poll_interval()
+            
         except Exception as e:
             self.error_handler.handle_error(e, "update_memory_stats", ErrorSeverity.LOW)
     
+    def _compute_poll_interval(self) -> int:
+        """Pick the next poll interval from current memory pressure"""
+        process_mb = self.memory_stats.get('process_memory_mb', 0)
+        system_percent = self.memory_stats.get('system_memory_percent', 0)
+        
+        if self._should_cleanup():
+            return 5
+        if process_mb < 200 and system_percent < 60:
+            return 120
+        return 30
+    
     def _should_cleanup(self) -> bool:
         """Check if memory cleanup is needed"""
         if not self.memory_stats:
@@ -111,15 +150,26 @@ class MemoryManager:
         try:
             logging.info("Performing memory cleanup...")
             
+            # Drop callbacks whose owners have been collected
+            live_refs = []
+            callbacks = []
+            for callback_ref in self.cleanup_callbacks:
+                callback = callback_ref()
+                if callback is not None:
+                    live_refs.append(callback_ref)
+                    callbacks.append(callback)
+            self.cleanup_callbacks = live_refs
+            
             # Run registered cleanup callbacks
-            for callback in self.cleanup_callbacks:
+            for callback in callbacks:
                 try:
                     callback()
                 except Exception as e:
                     self.error_handler.handle_error(e, "cleanup_callback", ErrorSeverity.LOW)
             
-            # Force garbage collection
-            gc.collect()
+            # Force garbage collection; only sweep the oldest generation under system pressure
+            generation = 2 if self.memory_stats.get('system_memory_percent', 0) > 85 else 1
+            gc.collect(generation)
             
             logging.info("Memory cleanup completed")
             
@@ -127,33 +177,19 @@ class MemoryManager:
             self.error_handler.handle_error(e, "cleanup_memory", ErrorSeverity.MEDIUM)
     
     def get_memory_stats(self) -> Dict[str, Any]:
-        """Get current memory statistics"""
-        self._update_memory_stats()
+        """Get current memory statistics (refreshed at most once per second)"""
+        if not self.memory_stats or time.time() - self.memory_stats.get('last_update', 0) >= 1.0:
+            self._update_memory_stats()
         return self.memory_stats.copy()
     
     def optimize_memory_settings(self) -> Dict[str, str]:
         """Suggest optimal memory settings"""
         try:
             if PSUTIL_AVAILABLE:
-                system_memory = psutil.virtual_memory()
-                total_gb = system_memory.total / 1024 / 1024 / 1024
-                
-                if total_gb >= 16:
-                    suggested_max = "4G"
-                    suggested_min = "2G"
-                    reason = "High memory system detected"
-                elif total_gb >= 8:
-                    suggested_max = "3G"
-                    suggested_min = "1G"
-                    reason = "Medium memory system detected"
-                elif total_gb >= 4:
-                    suggested_max = "2G"
-                    suggested_min = "512M"
-                    reason = "Low memory system detected"
-                else:
-                    suggested_max = "1G"
-                    suggested_min = "256M"
-                    reason = "Very low memory system detected"
+                total_gb = self._total_ram_gb
+                suggested_max, suggested_min, reason = _MEMORY_TIERS[
+                    bisect_right(_MEMORY_TIER_BOUNDS_GB, total_gb)
+                ]
                 
                 return {
                     'suggested_max_memory': suggested_max,
@@ -180,72 +216,50 @@ class MemoryManager:
             }
 
 class LogManager:
-    """Log file management and cleanup"""
+    """Log file registry (rotation is handled by RotatingFileHandler in setup_logging)"""
     
     def __init__(self):
         self.registered_logs = []
-        self.max_log_size = 10 * 1024 * 1024  # 10MB
         
     def register_log_file(self, log_path: str):
         """Register a log file for management"""
         self.registered_logs.append(log_path)
-    
-    def cleanup_logs(self):
-        """Clean up log files"""
-        for log_path in self.registered_logs:
-            try:
-                log_file = Path(log_path)
-                if log_file.exists():
-                    size = log_file.stat().st_size
-                    if size > self.max_log_size:
-                        self._rotate_log(log_path)
-            except Exception as e:
-                logging.error(f"Failed to cleanup log {log_path}: {e}")
-    
-    def _rotate_log(self, log_path: str):
-        """Rotate a log file"""
-        try:
-            log_file = Path(log_path)
-            backup_file = log_file.with_suffix(f"{log_file.suffix}.old")
-            
-            if backup_file.exists():
-                backup_file.unlink()
-            
-            log_file.rename(backup_file)
-            logging.info(f"Rotated log file: {log_path}")
-            
-        except Exception as e:
-            logging.error(f"Failed to rotate log {log_path}: {e}")
 
 class TextWidgetManager:
     """Manages text widgets to prevent memory leaks"""
     
     def __init__(self):
+        # (weak reference to widget, max_lines)
         self.widgets = []
     
     def register_widget(self, widget, max_lines: int = 1000):
         """Register a text widget for management"""
-        self.widgets.append({
-            'widget': widget,
-            'max_lines': max_lines
-        })
+        self.widgets.append((weakref.ref(widget), max_lines))
     
     def cleanup_widgets(self):
         """Clean up text widgets"""
-        for widget_info in self.widgets:
+        alive = []
+        for widget_ref, max_lines in self.widgets:
+            widget = widget_ref()
+            if widget is None:
+                continue
+            alive.append((widget_ref, max_lines))
+            
             try:
-                widget = widget_info['widget']
-                max_lines = widget_info['max_lines']
+                # Get current line count from the end index
+                total_lines = int(widget.index('end-1c').split('.')[0])
+                excess = total_lines - max_lines
                 
-                # Get current line count
-                content = widget.get('1.0', 'end-1c')
-                lines = content.split('\n')
-                
-                if len(lines) > max_lines:
-                    # Keep only the last max_lines
-                    new_content = '\n'.join(lines[-max_lines:])
-                    widget.delete('1.0', 'end')
-                    widget.insert('1.0', new_content)
+                if excess > 0:
+                    # Keep only the last max_lines by deleting the leading lines
+                    state = str(widget.cget('state'))
+                    if state == 'disabled':
+                        widget.config(state='normal')
+                    widget.delete('1.0', f'{excess + 1}.0')
+                    if state == 'disabled':
+                        widget.config(state=state)
                     
             except Exception as e:
                 logging.error(f"Failed to cleanup text widget: {e}")
+        
+        self.widgets = alive
@@ -3,15 +3,96 @@ Mod Backup Manager for Minecraft Server Manager
 Handles creation, restoration, and management of mod backups
 """
 import os
-import json
+import re
+import errno
+import fnmatch
 import shutil
 import zipfile
+import time
+import struct
+import hashlib
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+
+from file_utils import ORJSON_AVAILABLE, load_json, dump_json, iter_files, copy_file
+
+# Optional msgpack sidecar for fast backup index loading
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Prefer BLAKE3 for archive checksums, with fallback to hashlib's BLAKE2b
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Zstandard zip entries are only supported natively from Python 3.14
+ZIP_ZSTANDARD = getattr(zipfile, "ZIP_ZSTANDARD", None)
+
+# Zip backups start with MAGIC + <u32 length> + metadata JSON so the
+# metadata can be read without opening the archive (zip readers skip it)
+METADATA_HEADER_MAGIC = b"MSMB"
+METADATA_HEADER = struct.Struct("<4sI")
+
+def _readmetadataheader(f) -> Optional[bytes]:
+    """Read the metadata header at the start of an open backup archive (None if absent)"""
+    header = f.read(METADATA_HEADER.size)
+    if len(header) != METADATA_HEADER.size:
+        return None
+    magic, length = METADATA_HEADER.unpack(header)
+    if magic != METADATA_HEADER_MAGIC:
+        return None
+    return f.read(length)
+
+# ZipFile.write copies through an 8 KiB buffer; use 1 MiB chunks instead
+_COPY_BUFSIZE = 1024 * 1024
+
+# Already-compressed formats gain nothing from recompression; store them as-is
+_STORED_EXTENSIONS = frozenset({
+    ".jar", ".zip", ".gz", ".xz", ".bz2", ".zst", ".7z", ".rar",
+    ".png", ".jpg", ".jpeg", ".ogg", ".mp3",
+})
+
+def _zipwrite(zf: zipfile.ZipFile, sourcefile: str, arcname: str,
+              compress_type: Optional[int] = None, compresslevel: Optional[int] = None):
+    """Add a regular file to a zip archive, using a large copy buffer where possible"""
+    compress_type = zf.compression if compress_type is None else compress_type
+    zinfo = zipfile.ZipInfo.from_file(sourcefile, arcname)
+    zinfo.compress_type = compress_type
+    
+    # Stored entries have no level. Compressed ones need ZipInfo.compress_level
+    # (Python 3.13+); before that only ZipFile.write takes a level
+    if compress_type != zipfile.ZIP_STORED:
+        if not hasattr(zinfo, "compress_level"):
+            zf.write(sourcefile, arcname, compress_type, compresslevel)
+            return
+        zinfo.compress_level = zf.compresslevel if compresslevel is None else compresslevel
+    
+    with open(sourcefile, 'rb') as src, zf.open(zinfo, 'w') as dest:
+        shutil.copyfileobj(src, dest, _COPY_BUFSIZE)
+
+def _hashfile(filepath: str, algorithm: Optional[str] = None) -> str:
+    """Hash a file in 1 MiB chunks, returning '<algorithm>:<hexdigest>'"""
+    if algorithm is None:
+        algorithm = "blake3" if BLAKE3_AVAILABLE else "blake2b"
+    if algorithm == "blake3":
+        hasher = blake3.blake3()
+    else:
+        hasher = hashlib.new(algorithm)
+    
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(_COPY_BUFSIZE), b''):
+            hasher.update(chunk)
+    return f"{algorithm}:{hasher.hexdigest()}"
 
 @dataclass
 class BackupInfo:
@@ -25,7 +106,10 @@ class BackupInfo:
     modcount: int
     enabledmods: int
     profilename: str
-    compressiontype: str  # 'zip', 'tar', 'copy'
+    compressiontype: str  # 'zip', 'zstd', 'tar', 'copy'
+    filefingerprints: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # relpath -> (size, mtime_ns)
+    references: Dict[str, str] = field(default_factory=dict)  # relpath -> backup holding the unchanged file
+    filehash: str = ""  # '<algorithm>:<hexdigest>' of the archive, empty for directory backups
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -36,7 +120,10 @@ class BackupInfo:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BackupInfo':
         """Create from dictionary"""
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        if isinstance(data['timestamp'], str):
+            data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        if 'filefingerprints' in data:
+            data['filefingerprints'] = {path: tuple(fp) for path, fp in data['filefingerprints'].items()}
         return cls(**data)
 
 class ModBackupManager:
@@ -49,6 +136,7 @@ class ModBackupManager:
         # Paths
         self.backupsdir = ""
         self.backupindexfile = ""
+        self.backupindexcachefile = ""
         
         # Backup index
         self.backupindex: Dict[str, BackupInfo] = {}
@@ -58,19 +146,34 @@ class ModBackupManager:
             "autobackupinterval": 24,  # hours
             "maxbackups": 10,
             "compressionlevel": 6,
-            "compressiontype": "zip",  # zip, tar, copy
+            "compressiontype": "zip",  # zip, zstd, tar, copy
+            "zstdlevel": 3,
             "includeconfigs": True,
             "includeworldgen": False,
             "excludepatterns": ["*.log", "*.tmp", "cache/*"],
             "enableautocleanup": True,
-            "backupbeforechanges": True
+            "backupbeforechanges": True,
+            "incrementalbackups": False,  # store unchanged files as references to earlier backups
+            "copyworkers": 8,  # parallel file copies (I/O bound)
+            "verifyonrestore": True  # check archive hash before restoring
         }
         
+        # Compiled exclude patterns (see getexcluderegex)
+        self.excludepatternskey = None
+        self.excluderegex = None
+        
         # State
         self.isbackingup = False
         self.isrestoring = False
         self.backupprogress = 0
         self.lastbackuptime = None
+        self.lastnotifyprogress = 0
+        self.lastnotifytime = 0.0
+        
+        # Auto backup scheduler
+        self.schedulerthread = None
+        self.schedulerwake = threading.Event()
+        self.shutdownevent = threading.Event()
         
         # Callbacks
         self.progresscallbacks = []
@@ -93,14 +196,18 @@ class ModBackupManager:
         if hasattr(self.modmanager, 'moddatadir') and self.modmanager.moddatadir:
             self.backupsdir = os.path.join(self.modmanager.moddatadir, "backups")
             self.backupindexfile = os.path.join(self.backupsdir, "backupindex.json")
+            self.backupindexcachefile = os.path.join(self.backupsdir, "backupindex.msgpack")
             os.makedirs(self.backupsdir, exist_ok=True)
     
     def loadbackupindex(self):
         """Load backup index from file"""
         try:
             if os.path.exists(self.backupindexfile):
-                with open(self.backupindexfile, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = self.loadbackupindexcache()
+                if data is None:
+                    with open(self.backupindexfile, 'rb') as f:
+                        raw = f.read()
+                    data = load_json(raw)
                 
                 self.backupindex = {}
                 for name, backupdata in data.items():
@@ -120,22 +227,76 @@ class ModBackupManager:
     def savebackupindex(self):
         """Save backup index to file"""
         try:
-            data = {}
-            for name, backupinfo in self.backupindex.items():
-                data[name] = backupinfo.to_dict()
+            if ORJSON_AVAILABLE:
+                # orjson serializes the BackupInfo dataclasses directly
+                payload = dump_json(self.backupindex)
+            else:
+                payload = dump_json({name: backupinfo.to_dict()
+                                     for name, backupinfo in self.backupindex.items()})
+            
+            with open(self.backupindexfile, 'wb') as f:
+                f.write(payload)
             
-            with open(self.backupindexfile, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.savebackupindexcache()
             
             logging.info("Backup index saved")
         except Exception as e:
             logging.error(f"Failed to save backup index: {e}")
     
+    def loadbackupindexcache(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the msgpack index sidecar if it is at least as new as the JSON index"""
+        if not MSGPACK_AVAILABLE:
+            return None
+        try:
+            # The JSON file stays the editable source of truth
+            if os.path.getmtime(self.backupindexcachefile) < os.path.getmtime(self.backupindexfile):
+                return None
+            with open(self.backupindexcachefile, 'rb') as f:
+                data = msgpack.unpackb(f.read(), timestamp=3, strict_map_key=False)
+            for backupdata in data.values():
+                # Timestamps are naive local times packed as UTC
+                backupdata['timestamp'] = backupdata['timestamp'].replace(tzinfo=None)
+            return data
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable backup index cache: {e}")
+            return None
+    
+    def savebackupindexcache(self):
+        """Write the msgpack sidecar of the backup index"""
+        if not MSGPACK_AVAILABLE:
+            return
+        try:
+            data = {}
+            for name, backupinfo in self.backupindex.items():
+                backupdata = asdict(backupinfo)
+                backupdata['timestamp'] = backupinfo.timestamp.replace(tzinfo=timezone.utc)
+                data[name] = backupdata
+            
+            with open(self.backupindexcachefile, 'wb') as f:
+                f.write(msgpack.packb(data, datetime=True))
+        except Exception as e:
+            logging.warning(f"Failed to save backup index cache: {e}")
+    
     def verifybackups(self):
         """Verify that backup files exist and remove orphaned entries"""
+        # One directory scan instead of a stat per backup
+        try:
+            with os.scandir(self.backupsdir) as it:
+                existing = {entry.name for entry in it}
+        except OSError:
+            existing = set()
+        backupsdir = os.path.normcase(os.path.abspath(self.backupsdir))
+        
         toremove = []
         for name, backupinfo in self.backupindex.items():
-            if not os.path.exists(backupinfo.filepath):
+            parent, filename = os.path.split(backupinfo.filepath)
+            if os.path.normcase(os.path.abspath(parent)) == backupsdir:
+                found = filename in existing
+            else:
+                found = os.path.exists(backupinfo.filepath)
+            if not found:
                 toremove.append(name)
                 logging.warning(f"Backup file missing: {backupinfo.filepath}")
         
@@ -159,9 +320,7 @@ class ModBackupManager:
             timestamp = datetime.now()
             backupname = f"backup_{backuptype}_{timestamp.strftime('%Y%m%d_%H%M%S')}"
             
-            # Create backup directory
             backupdir = os.path.join(self.backupsdir, backupname)
-            os.makedirs(backupdir, exist_ok=True)
             
             self.notifyprogress(10, "Preparing backup...")
             
@@ -172,27 +331,14 @@ class ModBackupManager:
             if totalfiles == 0:
                 return False, "No files to backup"
             
-            self.notifyprogress(20, "Copying files...")
+            # Skip files unchanged since the previous backup
+            filestobackup, fingerprints, references = self.splitincrementalfiles(filestobackup)
             
-            # Copy files
-            copiedfiles = 0
-            for sourcefile, relativepath in filestobackup:
-                try:
-                    targetfile = os.path.join(backupdir, relativepath)
-                    targetdir = os.path.dirname(targetfile)
-                    os.makedirs(targetdir, exist_ok=True)
-                    
-                    shutil.copy2(sourcefile, targetfile)
-                    copiedfiles += 1
-                    
-                    # Update progress
-                    progress = 20 + (copiedfiles / totalfiles) * 60
-                    self.notifyprogress(progress, f"Copied {copiedfiles}/{totalfiles} files")
-                    
-                except Exception as e:
-                    logging.error(f"Error copying {sourcefile}: {e}")
-            
-            self.notifyprogress(80, "Creating backup metadata...")
+            # Count mods once for both the metadata and the index entry
+            installedmods = self.modmanager.installedmods
+            modcount = len(installedmods)
+            enabledmods = sum(1 for m in installedmods.values() if m.isenabled)
+            profilename = profilename or self.modmanager.currentprofile
             
             # Create backup metadata
             backupmetadata = {
@@ -200,43 +346,30 @@ class ModBackupManager:
                 "description": description,
                 "type": backuptype,
                 "timestamp": timestamp.isoformat(),
-                "modcount": len(self.modmanager.installedmods),
-                "enabledmods": len([m for m in self.modmanager.installedmods.values() if m.isenabled]),
-                "profilename": profilename or self.modmanager.currentprofile,
-                "modlist": list(self.modmanager.installedmods.keys()),
-                "settings": dict(self.modmanager.settings)
+                "modcount": modcount,
+                "enabledmods": enabledmods,
+                "profilename": profilename,
+                "modlist": list(installedmods),
+                "settings": dict(self.modmanager.settings),
+                "references": references
             }
             
-            metadatafile = os.path.join(backupdir, "backup_metadata.json")
-            with open(metadatafile, 'w', encoding='utf-8') as f:
-                json.dump(backupmetadata, f, indent=2, ensure_ascii=False)
-            
-            # Compress if enabled
-            finalpath = backupdir
-            compressiontype = "copy"
-            
-            if self.settings["compressiontype"] == "zip":
-                self.notifyprogress(85, "Compressing backup...")
-                zippath = backupdir + ".zip"
-                
-                with zipfile.ZipFile(zippath, 'w', zipfile.ZIP_DEFLATED, 
-                                   compresslevel=self.settings["compressionlevel"]) as zf:
-                    for root, dirs, files in os.walk(backupdir):
-                        for file in files:
-                            filepath = os.path.join(root, file)
-                            arcname = os.path.relpath(filepath, backupdir)
-                            zf.write(filepath, arcname)
-                
-                # Remove uncompressed directory
-                shutil.rmtree(backupdir)
-                finalpath = zippath
-                compressiontype = "zip"
+            if self.settings["compressiontype"] in ("zip", "zstd"):
+                # Stream sources straight into the archive - no staging copy
+                finalpath = backupdir + ".zip"
+                compressiontype = self.writezipbackup(finalpath, filestobackup, backupmetadata)
+            else:
+                finalpath = backupdir
+                compressiontype = "copy"
+                self.writecopybackup(backupdir, filestobackup, backupmetadata)
             
             self.notifyprogress(90, "Updating backup index...")
             
-            # Calculate backup size
+            # Calculate backup size and checksum
+            filehash = ""
             if os.path.isfile(finalpath):
                 backupsize = os.path.getsize(finalpath)
+                filehash = _hashfile(finalpath)
             else:
                 backupsize = self.getdirectorysize(finalpath)
             
@@ -248,10 +381,13 @@ class ModBackupManager:
                 timestamp=timestamp,
                 filepath=finalpath,
                 filesize=backupsize,
-                modcount=len(self.modmanager.installedmods),
-                enabledmods=len([m for m in self.modmanager.installedmods.values() if m.isenabled]),
-                profilename=profilename or self.modmanager.currentprofile,
-                compressiontype=compressiontype
+                modcount=modcount,
+                enabledmods=enabledmods,
+                profilename=profilename,
+                compressiontype=compressiontype,
+                filefingerprints=fingerprints,
+                references=references,
+                filehash=filehash
             )
             
             # Add to index
@@ -278,27 +414,198 @@ class ModBackupManager:
             self.isbackingup = False
             self.backupprogress = 0
     
+    def splitincrementalfiles(self, filestobackup: List[Tuple[str, str]]
+                              ) -> Tuple[List[Tuple[str, str]], Dict[str, Tuple[int, int]], Dict[str, str]]:
+        """Split files into changed ones and references to the previous backup.
+        
+        Returns (files to store, fingerprints of all files, references).
+        """
+        fingerprints = {}
+        for sourcefile, relativepath in filestobackup:
+            try:
+                st = os.stat(sourcefile)
+                fingerprints[relativepath] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                pass
+        
+        if not self.settings.get("incrementalbackups", False):
+            return filestobackup, fingerprints, {}
+        
+        # Only reference a backup written with a compatible layout
+        wantzip = self.settings["compressiontype"] in ("zip", "zstd")
+        previous = None
+        for backupinfo in self.backupindex.values():
+            if not backupinfo.filefingerprints:
+                continue
+            if (backupinfo.compressiontype in ("zip", "zstd")) != wantzip:
+                continue
+            if previous is None or backupinfo.timestamp > previous.timestamp:
+                previous = backupinfo
+        
+        if previous is None:
+            return filestobackup, fingerprints, {}
+        
+        changed = []
+        references = {}
+        for sourcefile, relativepath in filestobackup:
+            oldfingerprint = previous.filefingerprints.get(relativepath)
+            if oldfingerprint is not None and tuple(oldfingerprint) == fingerprints.get(relativepath):
+                # Point at the backup that actually holds the bytes
+                references[relativepath] = previous.references.get(relativepath, previous.name)
+            else:
+                changed.append((sourcefile, relativepath))
+        
+        return changed, fingerprints, references
+    
+    def restorereferencedfiles(self, backupinfo: BackupInfo, tempdir: str):
+        """Extract files an incremental backup references from earlier backups"""
+        byorigin: Dict[str, List[str]] = {}
+        for relativepath, origin in backupinfo.references.items():
+            byorigin.setdefault(origin, []).append(relativepath)
+        
+        # Create each target directory once instead of once per file
+        for directory in {os.path.dirname(os.path.join(tempdir, relativepath))
+                          for relativepath in backupinfo.references}:
+            os.makedirs(directory, exist_ok=True)
+        
+        for origin, relativepaths in byorigin.items():
+            origininfo = self.backupindex.get(origin)
+            if origininfo is None or not os.path.exists(origininfo.filepath):
+                raise FileNotFoundError(f"Referenced backup missing: {origin}")
+            
+            if origininfo.compressiontype in ("zip", "zstd"):
+                with zipfile.ZipFile(origininfo.filepath, 'r') as zf:
+                    for relativepath in relativepaths:
+                        zf.extract(relativepath.replace(os.sep, "/"), tempdir)
+            else:
+                for relativepath in relativepaths:
+                    copy_file(os.path.join(origininfo.filepath, relativepath),
+                              os.path.join(tempdir, relativepath))
+    
+    def writezipbackup(self, zippath: str, filestobackup: List[Tuple[str, str]],
+                       backupmetadata: Dict[str, Any]) -> str:
+        """Write backup files and metadata directly into a zip archive.
+        
+        Returns the compression type actually used ('zstd' or 'zip').
+        """
+        self.notifyprogress(20, "Compressing files...")
+        
+        compressiontype = "zip"
+        compression = zipfile.ZIP_DEFLATED
+        compresslevel = self.settings["compressionlevel"]
+        if self.settings["compressiontype"] == "zstd":
+            if ZIP_ZSTANDARD is not None:
+                compressiontype = "zstd"
+                compression = ZIP_ZSTANDARD
+                compresslevel = self.settings.get("zstdlevel", 3)
+            else:
+                logging.warning("Zstandard zip compression not supported by this Python, using deflate")
+        
+        metadatabytes = dump_json(backupmetadata)
+        
+        with open(zippath, 'wb') as f:
+            # The header must be written before ZipFile is created: ZipFile records
+            # the current offset as the archive start and writes entries from there
+            f.write(METADATA_HEADER.pack(METADATA_HEADER_MAGIC, len(metadatabytes)))
+            f.write(metadatabytes)
+            
+            with zipfile.ZipFile(f, 'w', compression, compresslevel=compresslevel) as zf:
+                self.writezipentries(zf, filestobackup, metadatabytes)
+        
+        # Check the header survived, reading it the same way readbackupmetadata does
+        with open(zippath, 'rb') as f:
+            if _readmetadataheader(f) != metadatabytes:
+                logging.warning(f"Backup metadata header missing from {zippath}")
+        
+        return compressiontype
+    
+    def writezipentries(self, zf: zipfile.ZipFile, filestobackup: List[Tuple[str, str]],
+                        metadatabytes: bytes):
+        """Write backup files and the metadata entry into an open zip archive"""
+        totalfiles = len(filestobackup)
+        writtenfiles = 0
+        for sourcefile, relativepath in filestobackup:
+            try:
+                if os.path.splitext(sourcefile)[1].lower() in _STORED_EXTENSIONS:
+                    _zipwrite(zf, sourcefile, relativepath, compress_type=zipfile.ZIP_STORED)
+                else:
+                    _zipwrite(zf, sourcefile, relativepath)
+                writtenfiles += 1
+                
+                progress = 20 + (writtenfiles / totalfiles) * 65
+                self.notifyprogressthrottled(progress, f"Compressed {writtenfiles}/{totalfiles} files")
+                
+            except Exception as e:
+                logging.error(f"Error compressing {sourcefile}: {e}")
+        
+        self.notifyprogress(85, "Writing backup metadata...")
+        zf.writestr("backup_metadata.json", metadatabytes)
+    
+    def writecopybackup(self, backupdir: str, filestobackup: List[Tuple[str, str]],
+                        backupmetadata: Dict[str, Any]):
+        """Copy backup files and metadata into a plain backup directory"""
+        totalfiles = len(filestobackup)
+        self.notifyprogress(20, "Copying files...")
+        
+        # Create every target directory once, then copy in parallel
+        targets = [(sourcefile, os.path.join(backupdir, relativepath))
+                   for sourcefile, relativepath in filestobackup]
+        os.makedirs(backupdir, exist_ok=True)
+        for targetdir in {os.path.dirname(t) for _, t in targets}:
+            os.makedirs(targetdir, exist_ok=True)
+        
+        copiedfiles = 0
+        workers = max(1, int(self.settings.get("copyworkers", 8)))
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="ModBackupCopy") as executor:
+            futures = {executor.submit(copy_file, src, dst): src for src, dst in targets}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Error copying {futures[future]}: {e}")
+                    continue
+                
+                # as_completed yields on this thread only, so no lock is needed
+                copiedfiles += 1
+                progress = 20 + (copiedfiles / totalfiles) * 65
+                self.notifyprogressthrottled(progress, f"Copied {copiedfiles}/{totalfiles} files")
+        
+        self.notifyprogress(85, "Writing backup metadata...")
+        metadatafile = os.path.join(backupdir, "backup_metadata.json")
+        with open(metadatafile, 'wb') as f:
+            f.write(dump_json(backupmetadata))
+    
     def gatherbackupfiles(self) -> List[Tuple[str, str]]:
         """Gather files that should be included in backup"""
         filestobackup = []
         
-        # Mods directory
-        if os.path.exists(self.modmanager.modsdir):
-            for root, dirs, files in os.walk(self.modmanager.modsdir):
-                for file in files:
-                    if not self.shouldexcludefile(file):
-                        filepath = os.path.join(root, file)
-                        relativepath = os.path.relpath(filepath, self.modmanager.serverdir)
-                        filestobackup.append((filepath, relativepath))
-        
-        # Config directory (if enabled)
-        if self.settings["includeconfigs"] and os.path.exists(self.modmanager.configdir):
-            for root, dirs, files in os.walk(self.modmanager.configdir):
-                for file in files:
-                    if not self.shouldexcludefile(file):
-                        filepath = os.path.join(root, file)
-                        relativepath = os.path.relpath(filepath, self.modmanager.serverdir)
-                        filestobackup.append((filepath, relativepath))
+        # Resolve the exclude regex once rather than per file
+        excluderegex = self.getexcluderegex()
+        isexcluded = excluderegex.match if excluderegex is not None else None
+        
+        # Paths under the server dir get their relative path by slicing,
+        # avoiding os.path.relpath's abspath work on every file
+        serverdir = self.modmanager.serverdir
+        serverprefix = os.path.join(serverdir, "")
+        prefixlen = len(serverprefix)
+        append = filestobackup.append
+        
+        sourcedirs = [self.modmanager.modsdir]
+        if self.settings["includeconfigs"]:
+            sourcedirs.append(self.modmanager.configdir)
+        
+        # Mods and config directories
+        for sourcedir in sourcedirs:
+            if not os.path.exists(sourcedir):
+                continue
+            for entry in iter_files(sourcedir):
+                if isexcluded is None or isexcluded(entry.name.lower()) is None:
+                    filepath = entry.path
+                    if filepath.startswith(serverprefix):
+                        append((filepath, filepath[prefixlen:]))
+                    else:
+                        append((filepath, os.path.relpath(filepath, serverdir)))
         
         # Mod manager data
         if os.path.exists(self.modmanager.moddatadir):
@@ -310,15 +617,127 @@ class ModBackupManager:
         
         return filestobackup
     
+    def getexcluderegex(self):
+        """Get the exclude patterns compiled into one regex, rebuilt when they change"""
+        patterns = tuple(self.settings["excludepatterns"])
+        if patterns != self.excludepatternskey:
+            if patterns:
+                self.excluderegex = re.compile(
+                    "|".join(fnmatch.translate(pattern.lower()) for pattern in patterns)
+                )
+            else:
+                self.excluderegex = None
+            self.excludepatternskey = patterns
+        return self.excluderegex
+    
     def shouldexcludefile(self, filename: str) -> bool:
         """Check if file should be excluded from backup"""
-        import fnmatch
+        excluderegex = self.getexcluderegex()
+        return excluderegex is not None and excluderegex.match(filename.lower()) is not None
+    
+    def readbackupmetadata(self, backupname: str) -> Optional[Dict[str, Any]]:
+        """Read a backup's metadata without extracting the backup"""
+        backupinfo = self.backupindex.get(backupname)
+        if backupinfo is None:
+            return None
         
-        for pattern in self.settings["excludepatterns"]:
-            if fnmatch.fnmatch(filename.lower(), pattern.lower()):
-                return True
+        try:
+            if os.path.isdir(backupinfo.filepath):
+                with open(os.path.join(backupinfo.filepath, "backup_metadata.json"), 'rb') as f:
+                    raw = f.read()
+            else:
+                with open(backupinfo.filepath, 'rb') as f:
+                    raw = _readmetadataheader(f)
+                    if raw is None:
+                        # Older archive without a header
+                        f.seek(0)
+                        with zipfile.ZipFile(f) as zf:
+                            raw = zf.read("backup_metadata.json")
+            
+            return load_json(raw)
+        except Exception as e:
+            logging.error(f"Error reading metadata for {backupname}: {e}")
+            return None
+    
+    def verifybackuphash(self, backupinfo: BackupInfo) -> bool:
+        """Check an archive against its recorded checksum (skipped if none or disabled)"""
+        if not backupinfo.filehash or not self.settings.get("verifyonrestore", True):
+            return True
         
-        return False
+        algorithm = backupinfo.filehash.partition(":")[0]
+        if algorithm == "blake3" and not BLAKE3_AVAILABLE:
+            logging.warning(f"Cannot verify {backupinfo.name}: blake3 is not installed")
+            return True
+        
+        self.notifyprogress(5, "Verifying backup integrity...")
+        if _hashfile(backupinfo.filepath, algorithm) != backupinfo.filehash:
+            logging.error(f"Checksum mismatch for backup {backupinfo.name}")
+            return False
+        return True
+    
+    def extractzipbackup(self, zippath: str, targetdir: str):
+        """Extract a zip backup using a pool of threads, one ZipFile handle per thread"""
+        with zipfile.ZipFile(zippath, 'r') as zf:
+            entries = [info for info in zf.infolist() if not info.is_dir()]
+        
+        # Create directories up front so workers never race on makedirs
+        targetdirs = set()
+        for info in entries:
+            parts = info.filename.split('/')
+            if info.filename.startswith('/') or '..' in parts or ':' in parts[0]:
+                raise ValueError(f"Unsafe path in backup archive: {info.filename}")
+            targetdirs.add(os.path.join(targetdir, *parts[:-1]))
+        for directory in targetdirs:
+            os.makedirs(directory, exist_ok=True)
+        
+        local = threading.local()
+        handles = []
+        handleslock = threading.Lock()
+        
+        def extract(info):
+            zf = getattr(local, "zf", None)
+            if zf is None:
+                zf = local.zf = zipfile.ZipFile(zippath, 'r')
+                with handleslock:
+                    handles.append(zf)
+            zf.extract(info, targetdir)
+        
+        try:
+            workers = max(1, int(self.settings.get("copyworkers", 8)))
+            with ThreadPoolExecutor(max_workers=workers,
+                                    thread_name_prefix="ModBackupExtract") as executor:
+                # Consume the iterator so worker exceptions propagate
+                for _ in executor.map(extract, entries):
+                    pass
+        finally:
+            for zf in handles:
+                zf.close()
+    
+    def swapdirectory(self, sourcedir: str, targetdir: str):
+        """Replace targetdir with sourcedir by renaming, restoring the original on failure"""
+        olddir = targetdir + ".old"
+        if os.path.exists(olddir):
+            shutil.rmtree(olddir)
+        
+        hadtarget = os.path.exists(targetdir)
+        try:
+            if hadtarget:
+                os.rename(targetdir, olddir)
+            try:
+                os.rename(sourcedir, targetdir)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Staging area is on another filesystem; fall back to copying
+                shutil.copytree(sourcedir, targetdir, copy_function=copy_file)
+        except Exception:
+            if hadtarget and os.path.exists(olddir):
+                shutil.rmtree(targetdir, ignore_errors=True)
+                os.rename(olddir, targetdir)
+            raise
+        
+        if hadtarget:
+            shutil.rmtree(olddir, ignore_errors=True)
     
     def restorebackup(self, backupname: str, restoreoptions: Dict[str, bool] = None) -> Tuple[bool, str]:
         """Restore from backup"""
@@ -337,6 +756,9 @@ class ModBackupManager:
             if not os.path.exists(backupinfo.filepath):
                 return False, "Backup file not found"
             
+            if not self.verifybackuphash(backupinfo):
+                return False, "Backup file is corrupted (checksum mismatch)"
+            
             # Default restore options
             if restoreoptions is None:
                 restoreoptions = {
@@ -363,9 +785,8 @@ class ModBackupManager:
             
             self.notifyprogress(25, "Extracting backup...")
             
-            if backupinfo.compressiontype == "zip":
-                with zipfile.ZipFile(backupinfo.filepath, 'r') as zf:
-                    zf.extractall(tempdir)
+            if backupinfo.compressiontype in ("zip", "zstd"):
+                self.extractzipbackup(backupinfo.filepath, tempdir)
             else:
                 # Copy directory
                 if os.path.isdir(backupinfo.filepath):
@@ -373,9 +794,13 @@ class ModBackupManager:
                         source = os.path.join(backupinfo.filepath, item)
                         dest = os.path.join(tempdir, item)
                         if os.path.isdir(source):
-                            shutil.copytree(source, dest)
+                            shutil.copytree(source, dest, copy_function=copy_file)
                         else:
-                            shutil.copy2(source, dest)
+                            copy_file(source, dest)
+            
+            if backupinfo.references:
+                self.notifyprogress(35, "Resolving incremental files...")
+                self.restorereferencedfiles(backupinfo, tempdir)
             
             self.notifyprogress(40, "Restoring files...")
             
@@ -383,18 +808,14 @@ class ModBackupManager:
             if restoreoptions.get("restoremods", True):
                 modsbackupdir = os.path.join(tempdir, "mods")
                 if os.path.exists(modsbackupdir):
-                    if os.path.exists(self.modmanager.modsdir):
-                        shutil.rmtree(self.modmanager.modsdir)
-                    shutil.copytree(modsbackupdir, self.modmanager.modsdir)
+                    self.swapdirectory(modsbackupdir, self.modmanager.modsdir)
                     self.notifyprogress(60, "Mods restored")
             
             # Restore configs
             if restoreoptions.get("restoreconfigs", True):
                 configbackupdir = os.path.join(tempdir, "config")
                 if os.path.exists(configbackupdir):
-                    if os.path.exists(self.modmanager.configdir):
-                        shutil.rmtree(self.modmanager.configdir)
-                    shutil.copytree(configbackupdir, self.modmanager.configdir)
+                    self.swapdirectory(configbackupdir, self.modmanager.configdir)
                     self.notifyprogress(80, "Configs restored")
             
             # Restore mod manager data
@@ -405,7 +826,7 @@ class ModBackupManager:
                         sourcefile = os.path.join(databackupdir, file)
                         if os.path.exists(sourcefile):
                             targetfile = os.path.join(self.modmanager.moddatadir, file)
-                            shutil.copy2(sourcefile, targetfile)
+                            copy_file(sourcefile, targetfile)
                     self.notifyprogress(90, "Profiles restored")
             
             # Reload mod manager data
@@ -441,6 +862,11 @@ class ModBackupManager:
             
             backupinfo = self.backupindex[backupname]
             
+            # Incremental backups may still need files stored in this one
+            for other in self.backupindex.values():
+                if other.name != backupname and backupname in other.references.values():
+                    return False, f"Backup is referenced by incremental backup {other.name}"
+            
             # Remove backup file/directory
             if os.path.exists(backupinfo.filepath):
                 if os.path.isfile(backupinfo.filepath):
@@ -480,8 +906,9 @@ class ModBackupManager:
             for i in range(toremove):
                 backupname, backupinfo = sortedbackups[i]
                 if backupinfo.backuptype != "manual":  # Keep manual backups
-                    self.deletebackup(backupname)
-                    logging.info(f"Auto-cleaned backup: {backupname}")
+                    success, _ = self.deletebackup(backupname)
+                    if success:
+                        logging.info(f"Auto-cleaned backup: {backupname}")
             
         except Exception as e:
             logging.error(f"Error cleaning up backups: {e}")
@@ -490,35 +917,66 @@ class ModBackupManager:
         """Calculate total size of directory"""
         totalsize = 0
         try:
-            for root, dirs, files in os.walk(dirpath):
-                for file in files:
-                    filepath = os.path.join(root, file)
-                    if os.path.exists(filepath):
-                        totalsize += os.path.getsize(filepath)
+            # DirEntry.stat() reuses data from the directory scan where possible
+            totalsize = sum(entry.stat().st_size for entry in iter_files(dirpath))
         except Exception as e:
             logging.error(f"Error calculating directory size: {e}")
         return totalsize
     
     def schedulenextautobackup(self):
-        """Schedule next automatic backup"""
-        if self.settings["autobackupinterval"] > 0:
+        """Start the auto backup scheduler, or restart its countdown if running"""
+        if self.schedulerthread and self.schedulerthread.is_alive():
+            # Wake the loop so it picks up the current interval
+            self.schedulerwake.set()
+        elif self.settings["autobackupinterval"] > 0 and not self.shutdownevent.is_set():
+            self.schedulerthread = threading.Thread(
+                target=self.autobackuploop, name="ModAutoBackup", daemon=True
+            )
+            self.schedulerthread.start()
+    
+    def autobackuploop(self):
+        """Run automatic backups on a single long-lived thread"""
+        while not self.shutdownevent.is_set():
             interval = self.settings["autobackupinterval"] * 3600  # Convert hours to seconds
+            if interval <= 0:
+                break
+            
+            woken = self.schedulerwake.wait(interval)
+            self.schedulerwake.clear()
+            if woken:
+                continue  # Rescheduled or shutting down
             
-            def autobackup():
+            try:
                 logging.info("Running scheduled auto backup")
                 self.createbackup("auto", "Scheduled automatic backup")
-                self.schedulenextautobackup()  # Schedule next one
-            
-            timer = threading.Timer(interval, autobackup)
-            timer.daemon = True
-            timer.start()
+            except Exception as e:
+                logging.error(f"Scheduled auto backup failed: {e}")
+    
+    def shutdown(self):
+        """Stop the auto backup scheduler and save the backup index"""
+        self.shutdownevent.set()
+        self.schedulerwake.set()
+        if self.schedulerthread and self.schedulerthread is not threading.current_thread():
+            self.schedulerthread.join(timeout=5.0)
+        self.schedulerthread = None
+        self.savebackupindex()
     
     def notifyprogress(self, progress: int, message: str):
         """Notify progress callbacks"""
         self.backupprogress = progress
+        self.lastnotifyprogress = progress
+        self.lastnotifytime = time.monotonic()
         for callback in self.progresscallbacks:
             callback(progress, message)
     
+    def notifyprogressthrottled(self, progress: float, message: str):
+        """Notify progress callbacks at most once per 1% step or 100 ms (per-file loops)"""
+        if (progress - self.lastnotifyprogress < 1
+                and time.monotonic() - self.lastnotifytime < 0.1):
+            self.backupprogress = progress
+            return
+        self.notifyprogress(progress, message)
+    
     def registerprogresscallback(self, callback):
         """Register progress callback"""
         self.progresscallbacks.append(callback)
@@ -3,16 +3,158 @@ Mod Configuration Manager for Minecraft Server Manager
 Handles mod configuration files, editing, and validation
 """
 import os
+import re
+import sys
+import gzip
 import json
 import logging
-import shutil
-import configparser
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-import toml
-import yaml
+
+from file_utils import load_json, dump_json, iter_files, copy_file
+
+# Optional JSON Schema support for config templates (compiled validators)
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+# Optional filesystem watching so config changes don't need a full rescan
+try:
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Format parsers are imported on first use so configs that are all JSON
+# never pay for them
+_toml = None
+_yaml = None
+_yaml_loader = None
+_yaml_dumper = None
+
+def _write_atomic(path: str, payload: bytes):
+    """Write to a temp file beside path and swap it in so a crash never leaves a torn file"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=directory, prefix=".tmp-", suffix=".tmp",
+                                     delete=False) as f:
+        f.write(payload)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.remove(f.name)
+        raise
+
+def _get_toml():
+    """Import toml on first use"""
+    global _toml
+    if _toml is None:
+        import toml as _toml
+    return _toml
+
+def _get_yaml():
+    """Import yaml on first use and resolve its safe loader/dumper.
+    
+    The C classes exist only when PyYAML was built against libyaml
+    (the default for binary wheels); otherwise the pure-Python ones are used.
+    """
+    global _yaml, _yaml_loader, _yaml_dumper
+    if _yaml is None:
+        import yaml
+        _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _yaml_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        _yaml = yaml
+    return _yaml
+
+# One logical .properties line: the key runs to the first unescaped '=', ':' or
+# whitespace, then optional whitespace, at most one '=' or ':', more whitespace
+_PROPERTIES_ENTRY = re.compile(r'((?:[^\\=:\s]|\\.)*)\s*[=:]?\s*(.*)', re.DOTALL)
+_PROPERTIES_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.DOTALL)
+_PROPERTIES_UNESCAPES = {'t': '\t', 'n': '\n', 'r': '\r', 'f': '\f'}
+_PROPERTIES_VALUE_ESCAPES = str.maketrans({
+    '\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t', '\f': '\\f',
+})
+_PROPERTIES_KEY_ESCAPES = str.maketrans({
+    '\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t', '\f': '\\f',
+    ' ': '\\ ', '=': '\\=', ':': '\\:', '#': '\\#', '!': '\\!',
+})
+
+def _unescape_properties(text: str) -> str:
+    """Decode .properties escapes (\\t, \\n, \\uXXXX, and \\x for any other x)"""
+    if '\\' not in text:
+        return text
+    
+    def replace(match):
+        escape = match.group(1)
+        if len(escape) == 5:
+            return chr(int(escape[1:], 16))
+        return _PROPERTIES_UNESCAPES.get(escape, escape)
+    
+    return _PROPERTIES_ESCAPE.sub(replace, text)
+
+def _escape_properties(text: str, key: bool = False) -> str:
+    """Encode a key or value so _parse_properties reads it back unchanged"""
+    if key:
+        return text.translate(_PROPERTIES_KEY_ESCAPES)
+    text = text.translate(_PROPERTIES_VALUE_ESCAPES)
+    # Leading whitespace would otherwise be taken as part of the separator
+    return '\\' + text if text[:1] == ' ' else text
+
+def _parse_properties(text: str) -> Dict[str, Any]:
+    """Parse Java .properties text; keys after a [section] header nest under it"""
+    data: Dict[str, Any] = {}
+    target = data
+    pending = None
+    for line in text.splitlines():
+        if pending is not None:
+            # Continuation of the previous line; its leading whitespace is dropped
+            line = pending + line.lstrip()
+            pending = None
+        else:
+            line = line.lstrip()
+            if not line or line[0] in '#!':
+                continue
+            header = line.rstrip()
+            if header[0] == '[' and header[-1] == ']':
+                section = header[1:-1].strip()
+                target = data.setdefault(section, {})
+                if not isinstance(target, dict):
+                    raise ValueError(f"Section [{section}] conflicts with key '{section}'")
+                continue
+        
+        # An odd number of trailing backslashes continues the line
+        if (len(line) - len(line.rstrip('\\'))) % 2:
+            pending = line[:-1]
+            continue
+        
+        key, value = _PROPERTIES_ENTRY.match(line).groups()
+        key = _unescape_properties(key)
+        if target is data and isinstance(data.get(key), dict):
+            raise ValueError(f"Key '{key}' conflicts with section [{key}]")
+        target[key] = _unescape_properties(value)
+    
+    if pending is not None:
+        key, value = _PROPERTIES_ENTRY.match(pending).groups()
+        target[_unescape_properties(key)] = _unescape_properties(value)
+    return data
+
+# Separators ignored when matching config filenames to mod IDs and names
+_NORM_RE = re.compile(r'[-_\s]')
+
+def _norm(name: str) -> str:
+    """Normalize a mod ID, mod name or filename stem for fuzzy matching"""
+    return _NORM_RE.sub('', name.lower())
+
+# "<config filename>_YYYYMMDD_HHMMSS.bak", as written by create_config_backup
+_BAK_TS = re.compile(r'^(.*)_(\d{8}_\d{6})\.bak$')
 
 class ConfigFormat(Enum):
     """Supported configuration file formats"""
@@ -24,7 +166,13 @@ class ConfigFormat(Enum):
     HOCON = "hocon"
     UNKNOWN = "unknown"
 
-@dataclass
+# Enum .value goes through a descriptor; look the strings up in a plain dict
+_FORMAT_VALUES = {config_format: config_format.value for config_format in ConfigFormat}
+
+# Slotted dataclasses need Python 3.10; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ConfigFile:
     """Configuration file information"""
     filepath: str
@@ -35,6 +183,29 @@ class ConfigFile:
     backup_path: str = ""
     is_valid: bool = True
     error_message: str = ""
+    # Parsed contents cached by get_contents(), keyed on file (mtime_ns, size)
+    _parsed: Any = field(default=None, init=False, repr=False, compare=False)
+    _parsed_stamp: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    # Position in the manager's statistics arrays
+    _stats_slot: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def get_contents(self, manager: 'ModConfigManager') -> Tuple[bool, Any]:
+        """Parse the file with the manager's handler, reusing the last parse if unchanged"""
+        st = os.stat(self.filepath)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._parsed_stamp == stamp:
+            return True, self._parsed
+        
+        success, data = manager.format_handlers[self.format](self.filepath, 'read')
+        if success:
+            self._parsed = data
+            self._parsed_stamp = stamp
+        return success, data
+    
+    def invalidate_contents(self):
+        """Drop cached parsed contents"""
+        self._parsed = None
+        self._parsed_stamp = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -42,7 +213,7 @@ class ConfigFile:
             'filepath': self.filepath,
             'modid': self.modid,
             'config_type': self.config_type,
-            'format': self.format.value,
+            'format': _FORMAT_VALUES[self.format],
             'last_modified': self.last_modified.isoformat(),
             'backup_path': self.backup_path,
             'is_valid': self.is_valid,
@@ -63,6 +234,15 @@ class ConfigFile:
             error_message=data.get('error_message', '')
         )
 
+class _ConfigDirEventHandler:
+    """watchdog event handler that forwards events to the manager's debounce queue"""
+    
+    def __init__(self, manager: 'ModConfigManager'):
+        self.manager = manager
+    
+    def dispatch(self, event):
+        self.manager._queue_config_event(event)
+
 class ModConfigManager:
     """Comprehensive mod configuration management system"""
     
@@ -74,6 +254,37 @@ class ModConfigManager:
         self.config_files: Dict[str, List[ConfigFile]] = {}  # modid -> list of config files
         self.config_cache = {}
         self.config_templates = {}
+        self._compiled_validators: Dict[str, Any] = {}  # modid -> compiled schema validator
+        
+        # Guards config_files and the statistics arrays, which the UI thread, the
+        # watcher and the debounced database flush all touch
+        self._tracking_lock = threading.RLock()
+        
+        # Statistics kept as parallel arrays, one slot per tracked ConfigFile
+        self._formats: List[str] = []
+        self._valid_flags: List[bool] = []
+        self._stats_owners: List[ConfigFile] = []
+        
+        # Debounced config database writes
+        self._db_lock = threading.Lock()
+        self._db_dirty = False
+        self._db_flush_timer: Optional[threading.Timer] = None
+        
+        # Validation results keyed by path, reused while (mtime_ns, size) is unchanged
+        self._validation_cache: "OrderedDict[str, Tuple[int, int, bool, str]]" = OrderedDict()
+        self._validation_lock = threading.Lock()
+        self._validation_cache_size = 4096
+        
+        # Config directory watcher; events are batched and applied after a quiet period
+        self._observer = None
+        self._watch_lock = threading.Lock()
+        self._watch_pending: set = set()
+        self._watch_rescan = False
+        self._watch_timer: Optional[threading.Timer] = None
+        
+        # Mod association lookups, rebuilt for every scan
+        self._mod_association_index: Optional[Dict[str, str]] = None
+        self._mod_association_cache: Dict[str, str] = {}
         
         # Paths
         self.config_dir = ""
@@ -85,6 +296,7 @@ class ModConfigManager:
             "auto_backup_on_change": True,
             "validate_on_save": True,
             "auto_detect_configs": True,
+            "watch_config_dir": True,
             "backup_retention_days": 30,
             "enable_config_templates": True,
             "auto_format_configs": False,
@@ -116,6 +328,8 @@ class ModConfigManager:
             
             if self.settings["auto_detect_configs"]:
                 self.scan_config_files()
+                if self.settings["watch_config_dir"]:
+                    self.start_config_watcher()
             
             logging.info("ModConfigManager initialized")
         except Exception as e:
@@ -135,59 +349,118 @@ class ModConfigManager:
             if directory:
                 os.makedirs(directory, exist_ok=True)
     
+    def get_database_path(self) -> str:
+        """Path of the human-readable config database"""
+        return os.path.join(
+            self.modmanager.mod_data_dir,  # FIXED: was moddatadir
+            "config_database.json"
+        )
+    
     def load_config_database(self):
         """Load configuration database"""
         try:
-            database_file = os.path.join(
-                self.modmanager.mod_data_dir,  # FIXED: was moddatadir
-                "config_database.json"
+            database_file = self.get_database_path()
+            compressed_file = database_file + ".gz"
+            
+            # Prefer the compact gzip copy unless the JSON was edited/exported more recently
+            use_compressed = os.path.exists(compressed_file) and (
+                not os.path.exists(database_file) or
+                os.path.getmtime(compressed_file) >= os.path.getmtime(database_file)
             )
             
-            if os.path.exists(database_file):
-                with open(database_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            data = None
+            if use_compressed:
+                with gzip.open(compressed_file, 'rb') as f:
+                    data = load_json(f.read())
+            elif os.path.exists(database_file):
+                with open(database_file, 'rb') as f:
+                    data = load_json(f.read())
+            
+            if data is not None:
                 
                 # Convert data back to ConfigFile objects
-                for modid, config_data_list in data.items():
-                    config_files = []
-                    for config_data in config_data_list:
-                        try:
-                            config_file = ConfigFile.from_dict(config_data)
-                            config_files.append(config_file)
-                        except Exception as e:
-                            logging.error(f"Error loading config file data: {e}")
+                with self._tracking_lock:
+                    for modid, config_data_list in data.items():
+                        config_files = []
+                        for config_data in config_data_list:
+                            try:
+                                config_file = ConfigFile.from_dict(config_data)
+                                self._track_config_stats(config_file)
+                                config_files.append(config_file)
+                            except Exception as e:
+                                logging.error(f"Error loading config file data: {e}")
                     
-                    if config_files:
-                        self.config_files[modid] = config_files
+                        if config_files:
+                            self.config_files[modid] = config_files
                 
                 logging.info(f"Loaded config database with {len(self.config_files)} mod configurations")
         
         except Exception as e:
             logging.error(f"Failed to load config database: {e}")
-            self.config_files = {}
+            with self._tracking_lock:
+                self.config_files = {}
+                self._reset_config_stats()
     
     def save_config_database(self):
-        """Save configuration database"""
+        """Save configuration database (compact, gzip level 1)"""
         try:
-            database_file = os.path.join(
-                self.modmanager.mod_data_dir,  # FIXED: was moddatadir
-                "config_database.json"
-            )
+            database_file = self.get_database_path()
+            
+            # A full save supersedes any pending debounced flush
+            with self._db_lock:
+                self._db_dirty = False
+                if self._db_flush_timer is not None:
+                    self._db_flush_timer.cancel()
+                    self._db_flush_timer = None
             
             # Convert ConfigFile objects to serializable dict
             data = {}
-            for modid, config_files in self.config_files.items():
-                data[modid] = [cf.to_dict() for cf in config_files]
+            with self._tracking_lock:
+                for modid, config_files in self.config_files.items():
+                    data[modid] = [cf.to_dict() for cf in config_files]
             
-            os.makedirs(os.path.dirname(database_file), exist_ok=True)
-            with open(database_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_atomic(database_file + ".gz", gzip.compress(dump_json(data, indent=False), compresslevel=1))
             
             logging.info("Config database saved")
         
         except Exception as e:
             logging.error(f"Failed to save config database: {e}")
     
+    def export_config_database(self, export_path: str = None) -> Tuple[bool, str]:
+        """Write the config database as indented JSON (defaults to config_database.json)"""
+        try:
+            export_path = export_path or self.get_database_path()
+            with self._tracking_lock:
+                data = {modid: [cf.to_dict() for cf in config_files]
+                        for modid, config_files in self.config_files.items()}
+            _write_atomic(export_path, dump_json(data))
+            return True, export_path
+        except Exception as e:
+            logging.error(f"Failed to export config database: {e}")
+            return False, f"Export error: {str(e)}"
+    
+    def shutdown(self):
+        """Stop watching the config directory and save the database"""
+        self.stop_config_watcher()
+        self.save_config_database()
+    
+    def _schedule_db_flush(self, delay: float = 2.0):
+        """Mark the database dirty and save it once edits go quiet for `delay` seconds"""
+        with self._db_lock:
+            self._db_dirty = True
+            if self._db_flush_timer is not None:
+                self._db_flush_timer.cancel()
+            self._db_flush_timer = threading.Timer(delay, self._flush_db)
+            self._db_flush_timer.daemon = True
+            self._db_flush_timer.start()
+    
+    def _flush_db(self):
+        """Save the database if edits are still pending"""
+        with self._db_lock:
+            if not self._db_dirty:
+                return
+        self.save_config_database()
+    
     def load_config_templates(self):
         """Load configuration templates"""
         try:
@@ -198,12 +471,19 @@ class ModConfigManager:
                 if filename.endswith('.json'):
                     template_path = os.path.join(self.templates_dir, filename)
                     try:
-                        with open(template_path, 'r', encoding='utf-8') as f:
-                            template_data = json.load(f)
+                        with open(template_path, 'rb') as f:
+                            template_data = load_json(f.read())
                         
                         modid = os.path.splitext(filename)[0]
                         self.config_templates[modid] = template_data
                         
+                        # Templates that are JSON Schemas get compiled once here
+                        if isinstance(template_data, dict) and "$schema" in template_data:
+                            if FASTJSONSCHEMA_AVAILABLE:
+                                self._compiled_validators[modid] = fastjsonschema.compile(template_data)
+                            else:
+                                logging.debug(f"fastjsonschema not installed, schema for {modid} not enforced")
+                        
                     except Exception as e:
                         logging.error(f"Error loading config template {filename}: {e}")
             
@@ -220,15 +500,40 @@ class ModConfigManager:
             
             logging.info("Scanning for mod configuration files...")
             
-            # Clear existing config files
-            self.config_files.clear()
+            # Installed mods may have changed since the last scan
+            self._reset_mod_association()
             
-            # Scan config directory
-            for root, dirs, files in os.walk(self.config_dir):
-                for file in files:
-                    if any(file.endswith(ext) for ext in self.settings["config_file_extensions"]):
-                        filepath = os.path.join(root, file)
-                        self.analyze_config_file(filepath)
+            # One set lookup per file instead of an endswith() per extension
+            extensions = frozenset(ext.lower() for ext in self.settings["config_file_extensions"])
+            
+            # Collect candidates first; DirEntry carries the stat result
+            candidates = []
+            for entry in iter_files(self.config_dir):
+                name = entry.name
+                if name[name.rfind('.'):].lower() in extensions:
+                    try:
+                        candidates.append((entry.path, entry.stat()))
+                    except OSError:
+                        # Deleted since it was listed
+                        continue
+            
+            # Build the association index up front so workers only read it
+            self._mod_association_index = self.build_mod_association_index()
+            
+            # Parse/validate in parallel (I/O bound), then merge on this thread
+            results = []
+            if candidates:
+                workers = min(32, (os.cpu_count() or 1) * 4, len(candidates))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ConfigScan") as executor:
+                    results = list(executor.map(lambda c: self._analyze_one(*c), candidates))
+            
+            # Replace the tracked files in one step so readers never see a half-built set
+            with self._tracking_lock:
+                self.config_files.clear()
+                self._reset_config_stats()
+                for config_file in results:
+                    if config_file is not None:
+                        self._add_config_file(config_file)
             
             # Update mod info with config file information
             self.update_mod_config_info()
@@ -236,14 +541,183 @@ class ModConfigManager:
             # Save database
             self.save_config_database()
             
-            logging.info(f"Config scan completed. Found {sum(len(configs) for configs in self.config_files.values())} config files")
+            logging.info(f"Config scan completed. Found {len(self._formats)} config files")
         
         except Exception as e:
             logging.error(f"Error scanning config files: {e}")
+        
+        finally:
+            # Later lookups must see mods installed after this scan
+            self._reset_mod_association()
     
-    def analyze_config_file(self, filepath: str):
+    def analyze_config_file(self, filepath: str, st: Optional[os.stat_result] = None):
         """Analyze a configuration file and determine its mod association"""
+        config_file = self._analyze_one(filepath, st)
+        if config_file is not None:
+            self._add_config_file(config_file)
+    
+    def start_config_watcher(self) -> bool:
+        """Watch the config directory and update only the files that change"""
+        if not WATCHDOG_AVAILABLE or self._observer is not None:
+            return self._observer is not None
+        if not os.path.isdir(self.config_dir):
+            return False
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_ConfigDirEventHandler(self), self.config_dir, recursive=True)
+            observer.start()
+            self._observer = observer
+            logging.info(f"Watching {self.config_dir} for config changes")
+            return True
+        except Exception as e:
+            logging.error(f"Failed to start config watcher: {e}")
+            return False
+    
+    def stop_config_watcher(self):
+        """Stop the config directory watcher and drop queued events"""
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            if observer is not threading.current_thread():
+                observer.join(timeout=5.0)
+        with self._watch_lock:
+            if self._watch_timer is not None:
+                self._watch_timer.cancel()
+                self._watch_timer = None
+            self._watch_pending.clear()
+            self._watch_rescan = False
+    
+    def _queue_config_event(self, event, delay: float = 0.25):
+        """Collect a watcher event; editors write-then-rename, so wait for a quiet period"""
+        event_type = event.event_type
+        if event_type not in ('created', 'modified', 'deleted', 'moved', 'closed'):
+            return
+        with self._watch_lock:
+            if event.is_directory:
+                # Directory contents changing also fires per-file events; a directory
+                # appearing, vanishing or moving doesn't, so rescan for those
+                if event_type == 'modified' or event_type == 'closed':
+                    return
+                self._watch_rescan = True
+            else:
+                self._watch_pending.add(os.fsdecode(event.src_path))
+                if event_type == 'moved':
+                    self._watch_pending.add(os.fsdecode(event.dest_path))
+            if self._watch_timer is not None:
+                self._watch_timer.cancel()
+            self._watch_timer = threading.Timer(delay, self._apply_config_events)
+            self._watch_timer.daemon = True
+            self._watch_timer.start()
+    
+    def _apply_config_events(self):
+        """Re-analyze, add or drop the config files touched since the last batch"""
+        with self._watch_lock:
+            paths, self._watch_pending = self._watch_pending, set()
+            rescan, self._watch_rescan = self._watch_rescan, False
+            self._watch_timer = None
+        
+        try:
+            if rescan:
+                self.scan_config_files()
+                return
+            
+            # Mods may have been installed or removed since the last batch
+            self._reset_mod_association()
+            
+            extensions = frozenset(ext.lower() for ext in self.settings["config_file_extensions"])
+            changed = []
+            with self._tracking_lock:
+                for path in paths:
+                    filename = os.path.basename(path)
+                    if filename[filename.rfind('.'):].lower() not in extensions:
+                        continue
+                    
+                    existing = self._find_config_file(path)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        st = None
+                    
+                    if st is None:
+                        if existing is not None:
+                            self._remove_config_file(existing)
+                            changed.append(None)
+                        continue
+                    
+                    if existing is None:
+                        config_file = self._analyze_one(path, st)
+                        if config_file is None:
+                            continue
+                        self._add_config_file(config_file)
+                    else:
+                        # Our own writes were validated at this exact (mtime_ns, size) already
+                        with self._validation_lock:
+                            cached = self._validation_cache.get(path)
+                        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                            continue
+                        config_file = existing
+                        config_file.invalidate_contents()
+                        config_file.last_modified = datetime.fromtimestamp(st.st_mtime)
+                        config_file.is_valid, config_file.error_message = self.validate_config_file(config_file)
+                        self._update_config_stats(config_file)
+                    
+                    changed.append(config_file)
+            
+            if changed:
+                self.update_mod_config_info()
+                self._schedule_db_flush()
+                # Callbacks run outside the lock; they may call back into the manager
+                for config_file in changed:
+                    if config_file is not None:
+                        self.notify_config_changed(config_file)
+        
+        except Exception as e:
+            logging.error(f"Error applying config changes: {e}")
+    
+    def _find_config_file(self, filepath: str) -> Optional[ConfigFile]:
+        """Find the tracked ConfigFile for a path"""
+        modid = self.determine_mod_association(filepath, os.path.basename(filepath))
+        for config_file in self.config_files.get(modid, ()):
+            if config_file.filepath == filepath:
+                return config_file
+        # Entries loaded from an older database may be filed under another mod
+        for config_files in self.config_files.values():
+            for config_file in config_files:
+                if config_file.filepath == filepath:
+                    return config_file
+        return None
+    
+    def _remove_config_file(self, config_file: ConfigFile):
+        """Stop tracking a config file that no longer exists"""
+        with self._tracking_lock:
+            config_files = self.config_files.get(config_file.modid)
+            if config_files is not None:
+                try:
+                    config_files.remove(config_file)
+                except ValueError:
+                    pass
+                if not config_files:
+                    del self.config_files[config_file.modid]
+            self._untrack_config_stats(config_file)
+        self.invalidate_validation(config_file)
+    
+    def _add_config_file(self, config_file: ConfigFile):
+        """Start tracking an analyzed config file"""
+        with self._tracking_lock:
+            self._track_config_stats(config_file)
+            
+            # Add to tracking
+            if config_file.modid not in self.config_files:
+                self.config_files[config_file.modid] = []
+            
+            self.config_files[config_file.modid].append(config_file)
+    
+    def _analyze_one(self, filepath: str, st: Optional[os.stat_result] = None) -> Optional[ConfigFile]:
+        """Build and validate a ConfigFile without touching shared tracking state"""
         try:
+            if st is None:
+                st = os.stat(filepath)
             filename = os.path.basename(filepath)
             file_ext = os.path.splitext(filename)[1].lower()
             
@@ -262,20 +736,16 @@ class ModConfigManager:
                 modid=modid,
                 config_type=config_type,
                 format=config_format,
-                last_modified=datetime.fromtimestamp(os.path.getmtime(filepath))
+                last_modified=datetime.fromtimestamp(st.st_mtime)
             )
             
             # Validate the config file
             config_file.is_valid, config_file.error_message = self.validate_config_file(config_file)
-            
-            # Add to tracking
-            if modid not in self.config_files:
-                self.config_files[modid] = []
-            
-            self.config_files[modid].append(config_file)
+            return config_file
             
         except Exception as e:
             logging.error(f"Error analyzing config file {filepath}: {e}")
+            return None
     
     def detect_config_format(self, filepath: str, file_ext: str) -> ConfigFormat:
         """Detect the format of a configuration file"""
@@ -291,8 +761,29 @@ class ModConfigManager:
         
         return format_map.get(file_ext, ConfigFormat.UNKNOWN)
     
+    def _reset_mod_association(self):
+        """Drop cached mod associations so they are rebuilt from the installed mods"""
+        self._mod_association_index = None
+        self._mod_association_cache.clear()
+    
+    def build_mod_association_index(self) -> Dict[str, str]:
+        """Map normalized mod IDs and names to mod IDs (first installed mod wins)"""
+        index = {}
+        if hasattr(self.modmanager, 'installed_mods'):
+            for modid, modinfo in self.modmanager.installed_mods.items():
+                index.setdefault(_norm(modid), modid)
+                index.setdefault(_norm(modinfo.name), modid)
+        return index
+    
     def determine_mod_association(self, filepath: str, filename: str) -> str:
         """Determine which mod a config file belongs to"""
+        modid = self._mod_association_cache.get(filename)
+        if modid is None:
+            modid = self._mod_association_cache[filename] = self._determine_mod_association(filename)
+        return modid
+    
+    def _determine_mod_association(self, filename: str) -> str:
+        """Resolve a config filename to a mod ID without caching"""
         # Extract potential mod ID from filename
         base_name = os.path.splitext(filename)[0]
         
@@ -306,22 +797,16 @@ class ModConfigManager:
         
         # Check against installed mods - FIXED: attribute name
         if hasattr(self.modmanager, 'installed_mods'):
-            installed_mods = self.modmanager.installed_mods
-            
             # Exact match
-            if potential_modid in installed_mods:
+            if potential_modid in self.modmanager.installed_mods:
                 return potential_modid
             
-            # Fuzzy match
-            for modid, modinfo in installed_mods.items():
-                if (modid.lower().replace('_', '').replace('-', '') == 
-                    potential_modid.lower().replace('_', '').replace('-', '')):
-                    return modid
-                
-                # Check mod name similarity
-                if (modinfo.name.lower().replace(' ', '').replace('_', '').replace('-', '') == 
-                    potential_modid.lower().replace('_', '').replace('-', '')):
-                    return modid
+            # Fuzzy match on normalized mod ID or mod name
+            if self._mod_association_index is None:
+                self._mod_association_index = self.build_mod_association_index()
+            modid = self._mod_association_index.get(_norm(potential_modid))
+            if modid is not None:
+                return modid
         
         # Return potential modid if no match found
         return potential_modid
@@ -332,19 +817,56 @@ class ModConfigManager:
         
         if 'server' in filename_lower:
             return 'server'
-        elif 'client' in filename_lower:
+        if 'client' in filename_lower:
             return 'client'
-        elif 'common' in filename_lower:
-            return 'common'
-        else:
-            # Default to common
-            return 'common'
+        # "common" and anything unrecognised both map to common; no need to search for it
+        return 'common'
     
     def validate_config_file(self, config_file: ConfigFile) -> Tuple[bool, str]:
-        """Validate a configuration file"""
+        """Validate a configuration file, reusing the last result while the file is unchanged"""
+        path = config_file.filepath
         try:
-            if not os.path.exists(config_file.filepath):
-                return False, "File does not exist"
+            st = os.stat(path)
+        except FileNotFoundError:
+            return False, "File does not exist"
+        except OSError as e:
+            return False, f"Validation error: {str(e)}"
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._validation_lock:
+            cached = self._validation_cache.get(path)
+            if cached is not None and cached[:2] == stamp:
+                self._validation_cache.move_to_end(path)
+                return cached[2], cached[3]
+        
+        is_valid, error = self._validate_config_file(config_file)
+        
+        with self._validation_lock:
+            self._validation_cache[path] = (stamp[0], stamp[1], is_valid, error)
+            self._validation_cache.move_to_end(path)
+            while len(self._validation_cache) > self._validation_cache_size:
+                self._validation_cache.popitem(last=False)
+        return is_valid, error
+    
+    def invalidate_validation(self, config_file: ConfigFile):
+        """Forget the cached validation result for a config file"""
+        with self._validation_lock:
+            self._validation_cache.pop(config_file.filepath, None)
+    
+    def _validate_config_file(self, config_file: ConfigFile) -> Tuple[bool, str]:
+        """Validate a configuration file without caching"""
+        try:
+            # Parse and check against the mod's schema template, if any
+            validator = self._compiled_validators.get(config_file.modid)
+            if validator is not None and config_file.format in self.format_handlers:
+                success, data = config_file.get_contents(self)
+                if not success:
+                    return False, data
+                try:
+                    validator(data)
+                except fastjsonschema.JsonSchemaException as e:
+                    return False, f"Schema error: {e.message}"
+                return True, ""
             
             # Try to parse the file based on its format
             handler = self.format_handlers.get(config_file.format)
@@ -363,13 +885,14 @@ class ModConfigManager:
             if not hasattr(self.modmanager, 'installed_mods'):  # FIXED: attribute name
                 return
             
-            for modid, modinfo in self.modmanager.installed_mods.items():
-                if modid in self.config_files:
-                    modinfo.hasconfig = True
-                    modinfo.configfiles = [cf.filepath for cf in self.config_files[modid]]
-                else:
-                    modinfo.hasconfig = False
-                    modinfo.configfiles = []
+            with self._tracking_lock:
+                for modid, modinfo in self.modmanager.installed_mods.items():
+                    if modid in self.config_files:
+                        modinfo.hasconfig = True
+                        modinfo.configfiles = [cf.filepath for cf in self.config_files[modid]]
+                    else:
+                        modinfo.hasconfig = False
+                        modinfo.configfiles = []
             
             # Save updated mod database - FIXED: method name
             if hasattr(self.modmanager, 'save_database'):
@@ -381,9 +904,8 @@ class ModConfigManager:
     def read_config_file(self, config_file: ConfigFile) -> Tuple[bool, Union[Dict, str], str]:
         """Read and parse a configuration file"""
         try:
-            handler = self.format_handlers.get(config_file.format)
-            if handler:
-                return handler(config_file.filepath, 'read')
+            if config_file.format in self.format_handlers:
+                return config_file.get_contents(self)
             else:
                 # Fallback to reading as text
                 with open(config_file.filepath, 'r', encoding='utf-8') as f:
@@ -400,6 +922,9 @@ class ModConfigManager:
             if self.settings["auto_backup_on_change"]:
                 self.create_config_backup(config_file)
             
+            config_file.invalidate_contents()
+            self.invalidate_validation(config_file)
+            
             handler = self.format_handlers.get(config_file.format)
             if handler:
                 success, error = handler(config_file.filepath, 'write', content)
@@ -416,9 +941,10 @@ class ModConfigManager:
                 # Validate if enabled
                 if self.settings["validate_on_save"]:
                     config_file.is_valid, config_file.error_message = self.validate_config_file(config_file)
+                    self._update_config_stats(config_file)
                 
-                # Save database
-                self.save_config_database()
+                # Save database once edits settle
+                self._schedule_db_flush()
                 
                 # Notify callbacks
                 self.notify_config_changed(config_file)
@@ -444,7 +970,7 @@ class ModConfigManager:
             os.makedirs(os.path.dirname(backup_path), exist_ok=True)
             
             # Copy file
-            shutil.copy2(config_file.filepath, backup_path)
+            copy_file(config_file.filepath, backup_path)
             
             # Update config file backup path
             config_file.backup_path = backup_path
@@ -468,14 +994,17 @@ class ModConfigManager:
             current_backup = self.create_config_backup(config_file)
             
             # Restore from backup
-            shutil.copy2(restore_path, config_file.filepath)
+            copy_file(restore_path, config_file.filepath)
+            config_file.invalidate_contents()
+            self.invalidate_validation(config_file)
             
             # Update file info
             config_file.last_modified = datetime.now()
             config_file.is_valid, config_file.error_message = self.validate_config_file(config_file)
+            self._update_config_stats(config_file)
             
-            # Save database
-            self.save_config_database()
+            # Save database once edits settle
+            self._schedule_db_flush()
             
             # Notify callbacks
             self.notify_config_changed(config_file)
@@ -496,13 +1025,20 @@ class ModConfigManager:
             
             filename_base = os.path.basename(config_file.filepath)
             
-            for backup_file in os.listdir(backup_dir):
-                if backup_file.startswith(filename_base) and backup_file.endswith('.bak'):
-                    backup_path = os.path.join(backup_dir, backup_file)
-                    backup_time = datetime.fromtimestamp(os.path.getmtime(backup_path))
-                    backups.append((backup_path, backup_time))
-            
-            # Sort by modification time (newest first)
+            with os.scandir(backup_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(filename_base) and name.endswith('.bak')):
+                        continue
+                    # Backup time comes from the filename; only stat names we didn't write
+                    match = _BAK_TS.match(name)
+                    if match and match.group(1) == filename_base:
+                        backup_time = datetime.strptime(match.group(2), "%Y%m%d_%H%M%S")
+                    else:
+                        backup_time = datetime.fromtimestamp(entry.stat().st_mtime)
+                    backups.append((entry.path, backup_time))
+            
+            # Sort by backup time (newest first)
             backups.sort(key=lambda x: x[1], reverse=True)
             
         except Exception as e:
@@ -516,23 +1052,19 @@ class ModConfigManager:
             if not os.path.exists(self.backup_dir):
                 return
             
-            cutoff_date = datetime.now() - timedelta(days=self.settings["backup_retention_days"])
+            cutoff_ts = (datetime.now() - timedelta(days=self.settings["backup_retention_days"])).timestamp()
             removed_count = 0
             
-            for modid_dir in os.listdir(self.backup_dir):
-                mod_backup_dir = os.path.join(self.backup_dir, modid_dir)
-                if not os.path.isdir(mod_backup_dir):
-                    continue
-                
-                for backup_file in os.listdir(mod_backup_dir):
-                    backup_path = os.path.join(mod_backup_dir, backup_file)
+            with os.scandir(self.backup_dir) as mod_dirs:
+                for mod_dir in mod_dirs:
+                    if not mod_dir.is_dir(follow_symlinks=False):
+                        continue
                     
-                    if os.path.isfile(backup_path):
-                        backup_time = datetime.fromtimestamp(os.path.getmtime(backup_path))
-                        
-                        if backup_time < cutoff_date:
-                            os.remove(backup_path)
-                            removed_count += 1
+                    with os.scandir(mod_dir.path) as backups:
+                        for backup in backups:
+                            if backup.is_file(follow_symlinks=False) and backup.stat().st_mtime < cutoff_ts:
+                                os.remove(backup.path)
+                                removed_count += 1
             
             logging.info(f"Cleaned up {removed_count} old config backups")
             
@@ -544,11 +1076,18 @@ class ModConfigManager:
         """Handle JSON configuration files"""
         try:
             if operation == 'validate' or operation == 'read':
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(filepath, 'rb') as f:
+                    raw = f.read()
+                try:
+                    data = load_json(raw)
+                except ValueError:
+                    # Re-parse with stdlib json for its error message and leniency (NaN etc.)
+                    data = json.loads(raw.decode('utf-8'))
                 return True, data if operation == 'read' else ""
             
             elif operation == 'write' and content is not None:
+                # stdlib json, not orjson: orjson writes NaN/Infinity as null, which
+                # would silently change values that read() accepted
                 with open(filepath, 'w', encoding='utf-8') as f:
                     json.dump(content, f, indent=2, ensure_ascii=False)
                 return True, ""
@@ -565,12 +1104,12 @@ class ModConfigManager:
         try:
             if operation == 'validate' or operation == 'read':
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    data = toml.load(f)
+                    data = _get_toml().load(f)
                 return True, data if operation == 'read' else ""
             
             elif operation == 'write' and content is not None:
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    toml.dump(content, f)
+                    _get_toml().dump(content, f)
                 return True, ""
             
             return False, "Invalid operation"
@@ -583,12 +1122,13 @@ class ModConfigManager:
         try:
             if operation == 'validate' or operation == 'read':
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                    data = _get_yaml().load(f, Loader=_yaml_loader)
                 return True, data if operation == 'read' else ""
             
             elif operation == 'write' and content is not None:
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    yaml.dump(content, f, default_flow_style=False, allow_unicode=True)
+                    _get_yaml().dump(content, f, Dumper=_yaml_dumper,
+                                     default_flow_style=False, allow_unicode=True)
                 return True, ""
             
             return False, "Invalid operation"
@@ -600,26 +1140,29 @@ class ModConfigManager:
         """Handle Properties configuration files"""
         try:
             if operation == 'validate' or operation == 'read':
-                config = configparser.ConfigParser()
-                config.read(filepath, encoding='utf-8')
-                
-                # Convert to dict
-                data = {}
-                for section in config.sections():
-                    data[section] = dict(config[section])
+                with open(filepath, 'rb') as f:
+                    raw = f.read()
+                try:
+                    text = raw.decode('utf-8')
+                except UnicodeDecodeError:
+                    # Pre-Java 9 .properties files are ISO-8859-1
+                    text = raw.decode('latin-1')
                 
+                data = _parse_properties(text)
                 return True, data if operation == 'read' else ""
             
             elif operation == 'write' and content is not None:
-                config = configparser.ConfigParser()
-                
+                # Top-level keys first: anything after a [section] header belongs to it
+                lines = [f"{_escape_properties(str(key), key=True)}={_escape_properties(str(value))}\n"
+                         for key, value in content.items() if not isinstance(value, dict)]
                 for section, values in content.items():
-                    config.add_section(section)
-                    for key, value in values.items():
-                        config.set(section, key, str(value))
+                    if isinstance(values, dict):
+                        lines.append(f"[{section}]\n")
+                        lines.extend(f"{_escape_properties(str(k), key=True)}={_escape_properties(str(v))}\n"
+                                     for k, v in values.items())
                 
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    config.write(f)
+                    f.write("".join(lines))
                 
                 return True, ""
             
@@ -649,28 +1192,58 @@ class ModConfigManager:
     
     def get_mod_configs(self, modid: str) -> List[ConfigFile]:
         """Get all configuration files for a specific mod"""
-        return self.config_files.get(modid, [])
+        with self._tracking_lock:
+            return list(self.config_files.get(modid, ()))
     
     def get_all_configs(self) -> Dict[str, List[ConfigFile]]:
         """Get all configuration files"""
-        return self.config_files.copy()
+        with self._tracking_lock:
+            return {modid: list(config_files) for modid, config_files in self.config_files.items()}
+    
+    def _reset_config_stats(self):
+        """Forget all statistics slots"""
+        for owner in self._stats_owners:
+            owner._stats_slot = -1
+        self._formats = []
+        self._valid_flags = []
+        self._stats_owners = []
+    
+    def _track_config_stats(self, config_file: ConfigFile):
+        """Give a newly tracked ConfigFile a statistics slot"""
+        config_file._stats_slot = len(self._formats)
+        self._formats.append(_FORMAT_VALUES[config_file.format])
+        self._valid_flags.append(config_file.is_valid)
+        self._stats_owners.append(config_file)
+    
+    def _untrack_config_stats(self, config_file: ConfigFile):
+        """Release a ConfigFile's statistics slot, moving the last slot into the gap"""
+        slot = config_file._stats_slot
+        if not (0 <= slot < len(self._formats)) or self._stats_owners[slot] is not config_file:
+            return
+        last = self._stats_owners.pop()
+        last_format = self._formats.pop()
+        last_valid = self._valid_flags.pop()
+        if last is not config_file:
+            self._formats[slot] = last_format
+            self._valid_flags[slot] = last_valid
+            self._stats_owners[slot] = last
+            last._stats_slot = slot
+        config_file._stats_slot = -1
+    
+    def _update_config_stats(self, config_file: ConfigFile):
+        """Refresh a ConfigFile's validity in the statistics arrays"""
+        with self._tracking_lock:
+            slot = config_file._stats_slot
+            if 0 <= slot < len(self._valid_flags) and self._stats_owners[slot] is config_file:
+                self._valid_flags[slot] = config_file.is_valid
     
     def get_config_statistics(self) -> Dict[str, Any]:
         """Get configuration statistics"""
-        total_configs = sum(len(configs) for configs in self.config_files.values())
-        mods_with_configs = len(self.config_files)
-        
-        # Count by format
-        format_counts = {}
-        valid_configs = 0
-        
-        for configs in self.config_files.values():
-            for config in configs:
-                format_name = config.format.value
-                format_counts[format_name] = format_counts.get(format_name, 0) + 1
-                
-                if config.is_valid:
-                    valid_configs += 1
+        with self._tracking_lock:
+            total_configs = len(self._formats)
+            mods_with_configs = len(self.config_files)
+            format_counts = dict(Counter(self._formats))
+            valid_configs = sum(self._valid_flags)
         
         return {
             "total_config_files": total_configs,
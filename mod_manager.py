@@ -190,9 +190,12 @@ class ModManager:
             self.load_database()
             self.load_profiles()
             
-            # Initial scan if enabled
+            # Initial scan if enabled and the mods directory changed since the last one
             if self.settings.get("scan_on_startup", True) and self.server_dir:
-                threading.Thread(target=self.scan_mods, daemon=True).start()
+                if self.mods_unchanged():
+                    logging.info("Mods unchanged since last scan - skipping startup scan")
+                else:
+                    threading.Thread(target=self.scan_mods, daemon=True).start()
             
             logging.info("ModManager initialized successfully")
             
@@ -268,6 +271,9 @@ class ModManager:
                     if 'side' in mod_data:
                         mod_data['side'] = ModSide(mod_data['side'])
                     
+                    # save_database() does not write the filename; derive it from the path
+                    mod_data.setdefault('filename', os.path.basename(mod_data.get('file_path', '')))
+                    
                     self.installed_mods[mod_id] = ModInfo(**mod_data)
             
             logging.info(f"Loaded {len(self.installed_mods)} mods from database")
@@ -354,6 +360,21 @@ class ModManager:
     
     # === Mod Scanning and Detection ===
     
+    def get_mods_signature(self) -> Optional[str]:
+        """Cheap signature of the mods directory (mtime + entry count), or None"""
+        if not self.mods_dir:
+            return None
+        try:
+            return f"{os.stat(self.mods_dir).st_mtime_ns}:{len(os.listdir(self.mods_dir))}"
+        except OSError:
+            return None
+    
+    def mods_unchanged(self) -> bool:
+        """True if the mods directory matches the signature stored by the last scan"""
+        signature = self.get_mods_signature()
+        return bool(signature and self.installed_mods and
+                    signature == self.settings.get("mods_dir_signature"))
+    
     def scan_mods(self, force_rescan: bool = False) -> Dict[str, ModInfo]:
         """Scan for mods in the mods directory with detailed debugging"""
         print("=" * 50)
@@ -394,6 +415,9 @@ class ModManager:
             self.is_scanning = True
             self.scan_progress = 0
             
+            # Taken before listing so changes made during the scan trigger the next one
+            signature = self.get_mods_signature()
+            
             # Notify callbacks
             for callback in self.scan_callbacks:
                 callback("started", 0, "Starting mod scan...")
@@ -469,6 +493,11 @@ class ModManager:
             # Update scan time
             self.last_scan_time = datetime.now()
             
+            # Remember what was scanned so an unchanged directory is skipped next startup
+            if signature and signature != self.settings.get("mods_dir_signature"):
+                self.settings["mods_dir_signature"] = signature
+                self.save_settings()
+            
             # Log results
             new_count = len(new_mods)
             logging.info(f"Mod scan completed: {new_count} mods found, {len(updated_mods)} updated")
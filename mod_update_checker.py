@@ -26,7 +26,7 @@ class UpdateInfo:
     modid: str
     current_version: str
     latest_version: str
-    update_status: UpdateStatus
+    update_status: UpdateStatus = UpdateStatus.UNKNOWN
     download_url: str = ""
     changelog_url: str = ""
     release_date: datetime = None